@@ -1,14 +1,13 @@
+import importlib.util
 import typer
-import uvicorn
 from pathlib import Path
+from typing import Optional
 import os
 
-from astra_universal_rag.config import settings
-from astra_universal_rag.ingestion.ingest_commits import main as ingest_commits_main
-from astra_universal_rag.ingestion.ingest_pull_requests import (
-    main as ingest_pull_requests_main,
-)
-from astra_universal_rag.main import app as fastapi_app  # Import the FastAPI app
+from astra_universal_rag.config import get_settings
+
+# Heavy modules (FastAPI app, uvicorn, ingestion) are imported inside the
+# commands that need them so `astra --help` stays fast.
 
 cli_app = typer.Typer(
     help="Astra - Universal RAG CLI. Manage ingestion, run the API, and more."
@@ -23,8 +22,8 @@ def ingest_commits(
         "-r",
         help="Path to the Git repository to ingest commits from.",
     ),
-    output_dir: Path = typer.Option(
-        settings.commit_cache_dir,
+    output_dir: Optional[Path] = typer.Option(
+        None,
         "--output-dir",
         "-o",
         help="Output directory for memory cards. Defaults to configured commit cache directory.",
@@ -33,16 +32,20 @@ def ingest_commits(
     """
     Ingests commit history from a Git repository.
     """
+    output_dir = output_dir or get_settings().commit_cache_dir
     typer.echo(f"Ingesting commits from: {repo_path}")
     typer.echo(f"Outputting to: {output_dir}")
 
+    from astra_universal_rag.ingestion.ingest_commits import main as ingest_commits_main
+
     # Temporarily change the current working directory to the repo_path
     original_cwd = os.getcwd()
     try:
         os.chdir(repo_path)
         # Call the main function from ingest_commits.py
         # Note: ingest_commits_main expects no arguments as it uses global config
-        ingest_commits_main()
+        count = ingest_commits_main()
+        typer.echo(f"Ingested {count} commits")
     except Exception as e:
         typer.echo(f"Error during commit ingestion: {e}", err=True)
     finally:
@@ -57,8 +60,8 @@ def ingest_pull_requests(
         "-u",
         help="URL of the Git repository (e.g., GitHub) to ingest pull requests from.",
     ),
-    output_dir: Path = typer.Option(
-        settings.commit_cache_dir,
+    output_dir: Optional[Path] = typer.Option(
+        None,
         "--output-dir",
         "-o",  # Reusing commit_cache_dir for PRs for now
         help="Output directory for pull request memory cards. Defaults to configured commit cache directory.",
@@ -67,14 +70,69 @@ def ingest_pull_requests(
     """
     Ingests pull request data from a Git repository (e.g., GitHub).
     """
+    output_dir = output_dir or get_settings().commit_cache_dir
     typer.echo(f"Ingesting pull requests from: {repo_url}")
     typer.echo(f"Outputting to: {output_dir}")
 
+    from astra_universal_rag.ingestion.ingest_pull_requests import (
+        main as ingest_pull_requests_main,
+    )
+
     # Call the main function from ingest_pull_requests.py
     # Note: ingest_pull_requests_main expects no arguments as it uses global config
     ingest_pull_requests_main()
 
 
+@cli_app.command(name="ingest-repository")
+def ingest_repository(
+    repo_path: str = typer.Option(
+        ...,
+        "--repo-path",
+        "-r",
+        help="Path to the Git repository to ingest. Run ingest-commits on it first.",
+    ),
+    repo_url: str = typer.Option(
+        ...,
+        "--repo-url",
+        "-u",
+        help="URL identifying the repository in the graph.",
+    ),
+    bulk: bool = typer.Option(
+        False,
+        "--bulk",
+        help="Load the graph through LOAD CSV (needs APOC and the configured Neo4j import directory). Use for first-time ingestion of large repositories.",
+    ),
+):
+    """
+    Ingests a repository's cached commits and source files into the vector store and graph.
+    """
+    import asyncio
+
+    from astra_universal_rag.config_phase1 import get_phase1_settings
+    from astra_universal_rag.graph.neo4j_adapter import close_all_drivers
+    from astra_universal_rag.hybrid.hybrid_rag import HybridRAG
+
+    settings = get_phase1_settings()
+    typer.echo(f"Ingesting repository: {repo_path}{' (bulk)' if bulk else ''}")
+
+    async def run():
+        rag = HybridRAG()
+        await rag.initialize()
+        rag.initialize_graph(settings.neo4j_uri, settings.neo4j_username, settings.neo4j_password)
+        return await rag.ingest_repository(repo_path, repo_url, bulk=bulk)
+
+    try:
+        result = asyncio.run(run())
+        typer.echo(
+            f"Ingested {result['commits_ingested']} commits and {result['files_ingested']} files"
+        )
+    except Exception as e:
+        typer.echo(f"Error during repository ingestion: {e}", err=True)
+    finally:
+        # The pooled drivers are shared process-wide; release them on exit
+        close_all_drivers()
+
+
 @cli_app.command(name="run-api")
 def run_api(
     host: str = typer.Option(
@@ -84,12 +142,31 @@ def run_api(
     reload: bool = typer.Option(
         False, "--reload", help="Enable auto-reload for development."
     ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", help="Number of worker processes."
+    ),
+    loop: str = typer.Option(
+        "uvloop",
+        "--loop",
+        help="Event loop implementation (uvloop, asyncio or auto). Falls back to asyncio if uvloop is not installed.",
+    ),
 ):
     """
     Runs the FastAPI application.
     """
+    if loop == "uvloop" and importlib.util.find_spec("uvloop") is None:
+        typer.echo("uvloop is not installed, falling back to asyncio", err=True)
+        loop = "asyncio"
+
+    import uvicorn
+
     typer.echo(f"Starting FastAPI server on http://{host}:{port}")
-    uvicorn.run(fastapi_app, host=host, port=port, reload=reload)
+    # Uvicorn needs an import string to spawn workers or reload the app
+    if workers > 1 or reload:
+        app = "astra_universal_rag.main:app"
+    else:
+        from astra_universal_rag.main import app
+    uvicorn.run(app, host=host, port=port, reload=reload, workers=workers, loop=loop)
 
 
 if __name__ == "__main__":
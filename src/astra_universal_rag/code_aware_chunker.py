@@ -107,6 +107,38 @@ class CodeAwareChunker:
 
         return self._assess_chunk_quality(chunks)
 
+    def chunk_commit(self, commit: Dict[str, Any]) -> List[CodeChunk]:
+        """Chunk a commit record (sha, message, author, timestamp, files_changed)"""
+        message = commit.get("message", "")
+        files_changed = commit.get("files_changed", [])
+        content = message
+        if files_changed:
+            content += "\n\nFiles changed:\n" + "\n".join(files_changed)
+
+        # Limit size
+        if len(content) > self.standard_chunk_size:
+            content = content[: self.standard_chunk_size] + "\n... (truncated)"
+
+        summary = message.split("\n", 1)[0]
+        return [
+            CodeChunk(
+                content=content,
+                metadata={
+                    "sha": commit["sha"],
+                    "author": commit.get("author", ""),
+                    "timestamp": commit.get("timestamp", ""),
+                    "type": "commit",
+                    "files_changed_count": len(files_changed),
+                    "description": f"Commit {commit['sha'][:8]}: {summary}",
+                },
+                start_line=1,
+                end_line=content.count("\n") + 1,
+                chunk_type=ChunkType.DOCUMENTATION,
+                language="git",
+                importance="medium",
+            )
+        ]
+
     def _detect_language(self, file_ext: str, content: str) -> str:
         """Detect programming language from file extension and content"""
         ext_map = {
@@ -134,8 +166,17 @@ class CodeAwareChunker:
             tree = ast.parse(content)
             lines = content.split("\n")
 
+            # One walk collects both imports and classes (nested included)
+            import_nodes = []
+            class_nodes = []
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    import_nodes.append(node)
+                elif isinstance(node, ast.ClassDef):
+                    class_nodes.append(node)
+
             # Extract imports as a unified chunk
-            imports = self._extract_python_imports(tree, lines)
+            imports = self._extract_python_imports(import_nodes, lines)
             if imports:
                 chunks.append(
                     CodeChunk(
@@ -175,11 +216,10 @@ class CodeAwareChunker:
                 )
 
             # Extract classes with their methods (complete class definitions)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    class_chunk = self._extract_python_class(node, lines, file_path)
-                    if class_chunk:
-                        chunks.append(class_chunk)
+            for node in class_nodes:
+                class_chunk = self._extract_python_class(node, lines, file_path)
+                if class_chunk:
+                    chunks.append(class_chunk)
 
             # Extract standalone functions (not inside classes)
             for node in tree.body:  # Only top-level nodes
@@ -199,17 +239,16 @@ class CodeAwareChunker:
 
         return chunks
 
-    def _extract_python_imports(self, tree: ast.AST, lines: List[str]) -> str:
+    def _extract_python_imports(self, nodes: List[ast.stmt], lines: List[str]) -> str:
         """Extract all import statements"""
         import_lines = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                if hasattr(node, "lineno"):
-                    # Get the actual line text
-                    line_idx = node.lineno - 1
-                    if line_idx < len(lines):
-                        import_lines.append(lines[line_idx])
+        for node in nodes:
+            if hasattr(node, "lineno"):
+                # Get the actual line text
+                line_idx = node.lineno - 1
+                if line_idx < len(lines):
+                    import_lines.append(lines[line_idx])
 
         return "\n".join(import_lines) if import_lines else ""
 
@@ -3,6 +3,7 @@
 Configuration module for Astra RAG system
 """
 
+from functools import cache
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
@@ -33,6 +34,10 @@ class RAGSettings(BaseSettings):
         default=PROJECT_ROOT / "data" / ".rag_commits",
         description="Path to cached commit files",
     )
+    commit_cache_backend: str = Field(
+        default="json",
+        description="Commit cache format: 'json' (one file per commit) or 'sqlite'",
+    )
 
     collection_name: str = Field(
         default="astratrade_knowledge_base", description="ChromaDB collection name"
@@ -81,24 +86,40 @@ class RAGSettings(BaseSettings):
     )
 
 
-# --- Singleton Settings Instance ---
-# This creates a single, globally accessible instance of the settings.
-# Any module that imports 'settings' will get this same object.
-settings = RAGSettings()
+# --- Lazy Singleton Settings Instance ---
+# Settings are validated (and the .env file read) on first use, not at import,
+# so code paths that never touch configuration (e.g. `astra --help`) skip it.
+# Every caller of get_settings() gets the same object.
+@cache
+def get_settings() -> RAGSettings:
+    return RAGSettings()
+
 
 # --- Legacy RAG_CONFIG (for compatibility during refactor) ---
 # This dictionary is created from the single settings instance.
 # All paths are converted to strings to ensure compatibility with older components.
-RAG_CONFIG = {
-    "chroma_db_path": str(settings.chroma_db_path),
-    "commit_cache_dir": str(settings.commit_cache_dir),
-    "collection_name": settings.collection_name,
-    "embedding_model": settings.embedding_model,
-    "template_chunking": settings.template_chunking,
-    "grounded_citations": settings.grounded_citations,
-    "deep_doc_understanding": settings.deep_doc_understanding,
-    "chunk_size": settings.chunk_size,
-    "chunk_overlap": settings.chunk_overlap,
-    "quality_threshold": settings.quality_threshold,
-    "platforms": settings.platforms,
-}
+@cache
+def get_rag_config() -> dict:
+    settings = get_settings()
+    return {
+        "chroma_db_path": str(settings.chroma_db_path),
+        "commit_cache_dir": str(settings.commit_cache_dir),
+        "collection_name": settings.collection_name,
+        "embedding_model": settings.embedding_model,
+        "template_chunking": settings.template_chunking,
+        "grounded_citations": settings.grounded_citations,
+        "deep_doc_understanding": settings.deep_doc_understanding,
+        "chunk_size": settings.chunk_size,
+        "chunk_overlap": settings.chunk_overlap,
+        "quality_threshold": settings.quality_threshold,
+        "platforms": settings.platforms,
+    }
+
+
+def __getattr__(name: str):
+    # PEP 562: keep `from .config import settings, RAG_CONFIG` working lazily
+    if name == "settings":
+        return get_settings()
+    if name == "RAG_CONFIG":
+        return get_rag_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,17 @@
 Configuration updates for Phase 1 - Hybrid Architecture
 """
 
+import os
+from functools import cache
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from pathlib import Path
-from .config import RAGSettings
+from .config import PROJECT_ROOT, RAGSettings
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory, outside the source tree"""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "astra_universal_rag"
 
 
 class Phase1Settings(RAGSettings):
@@ -25,6 +32,22 @@ class Phase1Settings(RAGSettings):
         description="Neo4j password",
         default=""
     )
+    neo4j_max_connection_pool_size: int = Field(
+        default=50,
+        description="Maximum connections in the shared Neo4j driver pool"
+    )
+    neo4j_max_connection_lifetime: int = Field(
+        default=3600,
+        description="Seconds before a pooled Neo4j connection is recycled"
+    )
+    neo4j_connection_acquisition_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for a free pooled Neo4j connection"
+    )
+    neo4j_import_dir: Path = Field(
+        default=PROJECT_ROOT / "data" / "neo4j_import",
+        description="Host path of the Neo4j import directory used for LOAD CSV bulk ingestion"
+    )
     
     # Hybrid Search Configuration
     hybrid_search_enabled: bool = Field(
@@ -44,11 +67,50 @@ class Phase1Settings(RAGSettings):
         description="Weight for vector results in hybrid search (0-1)"
     )
     
+    # Semantic Query Cache Configuration
+    semantic_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse hybrid search results for near-identical queries"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Minimum cosine similarity for a semantic cache hit"
+    )
+    semantic_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum number of cached hybrid search results"
+    )
+    semantic_cache_ttl_seconds: float = Field(
+        default=3600.0,
+        description="Time-to-live for cached hybrid search results"
+    )
+    retrieval_disk_cache_enabled: bool = Field(
+        default=True,
+        description="Persist hybrid search results on disk across restarts"
+    )
+    retrieval_disk_cache_path: Path = Field(
+        default_factory=lambda: _user_cache_dir() / "retrieval_cache.db",
+        description="SQLite file for the on-disk retrieval cache"
+    )
+    retrieval_disk_cache_ttl_seconds: float = Field(
+        default=86400.0,
+        description="Time-to-live for results in the on-disk retrieval cache"
+    )
+    
     # Phase 1 Feature Flags
     dual_pipeline_ingestion: bool = Field(default=True)
     graph_relationship_extraction: bool = Field(default=True)
     hybrid_retrieval: bool = Field(default=True)
 
 
-# Create phase 1 settings instance
-phase1_settings = Phase1Settings()
+# Phase 1 settings instance, created on first use
+@cache
+def get_phase1_settings() -> Phase1Settings:
+    return Phase1Settings()
+
+
+def __getattr__(name: str):
+    # PEP 562: keep `from .config_phase1 import phase1_settings` working lazily
+    if name == "phase1_settings":
+        return get_phase1_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,9 +10,14 @@ from dataclasses import dataclass
 from datetime import datetime
 import asyncio
 import logging
+import time
+import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_EPSILON = 1e-9
+
 
 @dataclass
 class ConnectorConfig:
@@ -24,6 +29,7 @@ class ConnectorConfig:
     webhook_url: Optional[str] = None
     rate_limit: int = 100  # requests per minute
     batch_size: int = 50
+    max_concurrent_pages: int = 4  # pages prefetched in parallel
 
 
 @dataclass
@@ -37,12 +43,76 @@ class DataEntity:
     metadata: Dict[str, Any]
 
 
+class AsyncTokenBucket:
+    """
+    Async rate limiter allowing `rate` acquisitions per `period` seconds,
+    with bursts of up to `rate`. Use as `async with bucket:`.
+    """
+    
+    def __init__(self, rate: float, period: float = 60.0):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.fill_rate)
+        self._last = now
+        
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        # The lock keeps waiters in FIFO order
+        async with self._lock:
+            self._refill()
+            # Float rounding can leave a refilled bucket a hair short of a
+            # token; waiting out that residue would spin on ~1e-14s sleeps
+            while self._tokens < 1 - _TOKEN_EPSILON:
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+                self._refill()
+            self._tokens -= 1
+            
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
 class BaseConnector(ABC):
     """Abstract base class for all connectors"""
     
     def __init__(self, config: ConnectorConfig):
         self.config = config
-        self.rate_limiter = asyncio.Semaphore(config.rate_limit)
+        self.rate_limiter = AsyncTokenBucket(config.rate_limit, period=60.0)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, keeping connections alive across calls"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.rate_limit * 2,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                )
+            )
+        return self._session
+        
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
         
     @abstractmethod
     async def authenticate(self) -> bool:
@@ -71,15 +141,20 @@ class BaseConnector(ABC):
         
     async def fetch_with_retry(
         self, 
-        fetch_func, 
+        coro_factory, 
         max_retries: int = 3,
         backoff_factor: float = 2.0
-    ):
-        """Fetch with exponential backoff retry"""
+    ) -> Any:
+        """
+        Fetch with exponential backoff retry.
+        
+        `coro_factory()` must return a fresh awaitable that produces the
+        final parsed payload, so a failed attempt can be re-issued in full.
+        """
         for attempt in range(max_retries):
             try:
                 async with self.rate_limiter:
-                    return await fetch_func()
+                    return await coro_factory()
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise
@@ -88,3 +163,15 @@ class BaseConnector(ABC):
                     f"Retry {attempt + 1}/{max_retries} after {wait_time}s: {e}"
                 )
                 await asyncio.sleep(wait_time)
+                
+    async def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """GET a URL on the shared session and return the decoded JSON body"""
+        async with self.session.get(url, params=params, headers=headers) as resp:
+            if resp.status != 200:
+                raise Exception(f"{self.config.name} API error: {resp.status}")
+            return orjson.loads(await resp.read())
@@ -4,15 +4,43 @@ Jira Connector - Phase 2
 Integrates with Atlassian Jira for issue tracking data
 """
 
-import aiohttp
 import asyncio
-from typing import Dict, List, Any, Optional, AsyncIterator
+import logging
+import orjson
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, Dict, FrozenSet, List, Any, Optional, AsyncIterator, Tuple
 from datetime import datetime
 from .base_connector import BaseConnector, DataEntity, ConnectorConfig
 
 logger = logging.getLogger(__name__)
 
 
+# JQL clause builders, applied in this order for the filters present
+_FILTER_BUILDERS: Dict[str, Callable[[Any], str]] = {
+    "project": lambda v: f"project = {v}",
+    "updated_after": lambda v: f"updated >= {v}",
+    "assignee": lambda v: f"assignee = {v}",
+}
+
+
+@lru_cache(maxsize=128)
+def _jql_for(filter_items: FrozenSet[Tuple[str, Any]]) -> str:
+    """JQL for a set of (name, value) filter pairs"""
+    filters = dict(filter_items)
+    jql = " AND ".join(
+        build(filters[name])
+        for name, build in _FILTER_BUILDERS.items()
+        if name in filters
+    )
+    return f"{jql} ORDER BY updated DESC"
+
+
+def _field(value: Optional[Dict[str, Any]], name: str) -> Any:
+    """Read a sub-field of an optional Jira object field (which may be null)"""
+    return value[name] if value else None
+
+
 class JiraConnector(BaseConnector):
     """Connector for Atlassian Jira"""
     
@@ -23,12 +51,11 @@ class JiraConnector(BaseConnector):
             "Accept": "application/json"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.config.api_url}/rest/api/3/myself",
-                headers=headers
-            ) as response:
-                return response.status == 200
+        async with self.session.get(
+            f"{self.config.api_url}/rest/api/3/myself",
+            headers=headers
+        ) as response:
+            return response.status == 200
                 
     async def fetch_entities(
         self,
@@ -46,95 +73,109 @@ class JiraConnector(BaseConnector):
             "Accept": "application/json"
         }
         
-        start_at = 0
-        total_fetched = 0
+        url = f"{self.config.api_url}/rest/api/3/search"
+        batch_size = self.config.batch_size
         
-        async with aiohttp.ClientSession() as session:
-            while True:
-                if limit and total_fetched >= limit:
-                    break
-                    
-                params = {
-                    "jql": jql,
-                    "startAt": start_at,
-                    "maxResults": min(
-                        self.config.batch_size,
-                        limit - total_fetched if limit else self.config.batch_size
-                    )
-                }
-                
-                response = await self.fetch_with_retry(
-                    lambda: session.get(
-                        f"{self.config.api_url}/rest/api/3/search",
-                        headers=headers,
-                        params=params
-                    )
-                )
-                
-                async with response as resp:
-                    if resp.status != 200:
-                        raise Exception(f"Jira API error: {resp.status}")
-                        
-                    data = await resp.json()
-                    issues = data.get("issues", [])
+        def fetch_page(start_at: int, max_results: int):
+            params = {
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": max_results
+            }
+            return self.fetch_with_retry(
+                lambda: self._get_json(url, params=params, headers=headers)
+            )
+            
+        # The first page tells us the total and the page size the server
+        # actually honours (it may cap maxResults below what we asked for),
+        # after which the remaining pages are fetched concurrently and
+        # yielded in order
+        data = await fetch_page(0, min(batch_size, limit) if limit else batch_size)
+        issues = data.get("issues", [])
+        for entity in self._convert_page(issues):
+            yield entity
+        if not issues:
+            return
+            
+        end = data.get("total", 0)
+        if limit:
+            end = min(end, limit)
+        page_size = min(batch_size, len(issues))
+        offsets = deque(range(len(issues), end, page_size))
+        pending: Deque[Tuple[int, int, asyncio.Task]] = deque()
+        
+        try:
+            while offsets or pending:
+                while offsets and len(pending) < self.config.max_concurrent_pages:
+                    start_at = offsets.popleft()
+                    size = min(page_size, end - start_at)
+                    pending.append((start_at, size, asyncio.create_task(
+                        fetch_page(start_at, size)
+                    )))
                     
-                    if not issues:
-                        break
-                        
-                    for issue in issues:
-                        yield self._convert_to_entity(issue)
-                        total_fetched += 1
-                        
+                start_at, size, task = pending.popleft()
+                issues = (await task).get("issues", [])
+                # A short page leaves a gap before the next prefetched
+                # offset, so fetch the missing tail before moving on
+                while issues:
+                    for entity in self._convert_page(issues):
+                        yield entity
                     start_at += len(issues)
-                    
-                    if start_at >= data.get("total", 0):
+                    size -= len(issues)
+                    if size <= 0:
                         break
-                        
+                    issues = (await fetch_page(start_at, size)).get("issues", [])
+                if size > 0:
+                    break
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+                
     def _build_jql(self, filters: Optional[Dict[str, Any]]) -> str:
         """Build JQL query from filters"""
         if not filters:
             return "ORDER BY updated DESC"
+        try:
+            return _jql_for(frozenset(filters.items()))
+        except TypeError:
+            # Unhashable filter values can't be memoized
+            return _jql_for.__wrapped__(filters.items())
             
-        conditions = []
-        if "project" in filters:
-            conditions.append(f"project = {filters['project']}")
-        if "updated_after" in filters:
-            conditions.append(f"updated >= {filters['updated_after']}")
-        if "assignee" in filters:
-            conditions.append(f"assignee = {filters['assignee']}")
-            
-        jql = " AND ".join(conditions) if conditions else ""
-        return f"{jql} ORDER BY updated DESC"
-        
     def _convert_to_entity(self, issue: Dict[str, Any]) -> DataEntity:
         """Convert Jira issue to DataEntity"""
+        fields = issue["fields"]
+        get = fields.get
+        key = issue["key"]
         return DataEntity(
-            id=f"jira:{issue['key']}",
-            type="jira_ticket",
-            source="jira",
-            content={
-                "key": issue["key"],
-                "summary": issue["fields"]["summary"],
-                "description": issue["fields"].get("description", ""),
-                "status": issue["fields"]["status"]["name"],
-                "priority": issue["fields"].get("priority", {}).get("name"),
-                "assignee": issue["fields"].get("assignee", {}).get("displayName"),
-                "reporter": issue["fields"].get("reporter", {}).get("displayName"),
-                "labels": issue["fields"].get("labels", []),
-                "components": [c["name"] for c in issue["fields"].get("components", [])],
-                "fix_versions": [v["name"] for v in issue["fields"].get("fixVersions", [])]
+            f"jira:{key}",
+            "jira_ticket",
+            "jira",
+            {
+                "key": key,
+                "summary": fields["summary"],
+                "description": get("description", ""),
+                "status": fields["status"]["name"],
+                "priority": _field(get("priority"), "name"),
+                "assignee": _field(get("assignee"), "displayName"),
+                "reporter": _field(get("reporter"), "displayName"),
+                "labels": get("labels") or [],
+                "components": [c["name"] for c in get("components") or ()],
+                "fix_versions": [v["name"] for v in get("fixVersions") or ()]
             },
-            timestamp=datetime.fromisoformat(
-                issue["fields"]["updated"].replace("Z", "+00:00")
-            ),
-            metadata={
-                "project": issue["fields"]["project"]["key"],
-                "issue_type": issue["fields"]["issuetype"]["name"],
-                "created": issue["fields"]["created"],
-                "resolution": issue["fields"].get("resolution", {}).get("name")
+            datetime.fromisoformat(fields["updated"].replace("Z", "+00:00")),
+            {
+                "project": fields["project"]["key"],
+                "issue_type": fields["issuetype"]["name"],
+                "created": fields["created"],
+                "resolution": _field(get("resolution"), "name")
             }
         )
         
+    def _convert_page(self, issues: List[Dict[str, Any]]) -> List[DataEntity]:
+        """Convert a page of Jira issues in one pass"""
+        convert = self._convert_to_entity
+        return [convert(issue) for issue in issues]
+        
     async def setup_webhook(self, events: List[str]) -> bool:
         """Setup Jira webhook"""
         webhook_data = {
@@ -152,13 +193,12 @@ class JiraConnector(BaseConnector):
             "Content-Type": "application/json"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.config.api_url}/rest/webhooks/1.0/webhook",
-                headers=headers,
-                json=webhook_data
-            ) as response:
-                return response.status == 201
+        async with self.session.post(
+            f"{self.config.api_url}/rest/webhooks/1.0/webhook",
+            headers=headers,
+            data=orjson.dumps(webhook_data)
+        ) as response:
+            return response.status == 201
                 
     async def handle_webhook_event(self, event: Dict[str, Any]) -> DataEntity:
         """Process incoming Jira webhook event"""
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Async Neo4j Adapter - Phase 1
+Non-blocking graph reads for use inside the async search path
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Dict, List, Any, Optional, Tuple
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncTransaction
+from ..schemas.universal_schema import EntityType, RelationType
+from .neo4j_adapter import Neo4jAdapter
+
+logger = logging.getLogger(__name__)
+
+# Async drivers are bound to the event loop that created them, so the
+# process-wide pools are shared per loop, then per (uri, username). Loops
+# are held weakly, and drivers of loops that have closed are dropped on the
+# next lookup, so finished asyncio.run() calls don't pin their loops.
+_ASYNC_DRIVERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], AsyncDriver]]" = (
+    weakref.WeakKeyDictionary()
+)
+_ASYNC_DRIVERS_LOCK = threading.Lock()
+
+
+def _prune_closed_loops():
+    """Forget drivers whose loop has closed; they can no longer be awaited"""
+    for loop in [loop for loop in _ASYNC_DRIVERS.keys() if loop.is_closed()]:
+        del _ASYNC_DRIVERS[loop]
+
+
+async def close_all_async_drivers():
+    """Close the shared async drivers of the running loop, e.g. on shutdown"""
+    loop = asyncio.get_running_loop()
+    with _ASYNC_DRIVERS_LOCK:
+        drivers = _ASYNC_DRIVERS.pop(loop, {})
+        _prune_closed_loops()
+    for driver in drivers.values():
+        await driver.close()
+
+
+class AsyncNeo4jAdapter:
+    """Async counterpart of Neo4jAdapter for read queries"""
+    
+    def __init__(
+        self,
+        uri: str,
+        username: str,
+        password: str,
+        max_connection_pool_size: int = 50,
+        max_connection_lifetime: int = 3600,
+        connection_acquisition_timeout: float = 30.0
+    ):
+        self.uri = uri
+        self.username = username
+        self.password = password
+        self.max_connection_pool_size = max_connection_pool_size
+        self.max_connection_lifetime = max_connection_lifetime
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        
+    @property
+    def driver(self) -> AsyncDriver:
+        """Lookup of the shared async driver for this uri, user and the running loop"""
+        loop = asyncio.get_running_loop()
+        key = (self.uri, self.username)
+        with _ASYNC_DRIVERS_LOCK:
+            drivers = _ASYNC_DRIVERS.get(loop)
+            if drivers is None:
+                _prune_closed_loops()
+                drivers = _ASYNC_DRIVERS[loop] = {}
+            driver = drivers.get(key)
+            if driver is None:
+                driver = AsyncGraphDatabase.driver(
+                    self.uri,
+                    auth=(self.username, self.password),
+                    max_connection_pool_size=self.max_connection_pool_size,
+                    max_connection_lifetime=self.max_connection_lifetime,
+                    connection_acquisition_timeout=self.connection_acquisition_timeout
+                )
+                logger.info(f"Connected to Neo4j (async) at {self.uri}")
+                drivers[key] = driver
+        return driver
+        
+    async def close(self):
+        """Nothing to release per adapter; see close_all_async_drivers"""
+        
+    async def find_related_nodes(
+        self,
+        node_id: str,
+        relationship_types: List[RelationType],
+        max_depth: int = 2,
+        start_type: Optional[EntityType] = None
+    ) -> List[Dict[str, Any]]:
+        """Find all nodes related to a given node"""
+        related = await self.find_related_nodes_batch(
+            [node_id], relationship_types, max_depth, start_type
+        )
+        return related.get(node_id, [])
+        
+    async def find_related_nodes_batch(
+        self,
+        node_ids: List[str],
+        relationship_types: List[RelationType],
+        max_depth: int = 2,
+        start_type: Optional[EntityType] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find related nodes for many start nodes in a single round-trip.
+        Pass `start_type` when all start nodes share a known type.
+        """
+        if not node_ids:
+            return {}
+        async with self.driver.session() as session:
+            return await session.read_transaction(
+                self._find_related_nodes_batch_tx,
+                node_ids,
+                relationship_types,
+                max_depth,
+                start_type
+            )
+            
+    @staticmethod
+    async def _find_related_nodes_batch_tx(
+        tx: AsyncTransaction,
+        node_ids: List[str],
+        relationship_types: List[RelationType],
+        max_depth: int,
+        start_type: Optional[EntityType] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        query = Neo4jAdapter._related_nodes_batch_query(relationship_types, max_depth, start_type)
+        result = await tx.run(query, node_ids=list(node_ids))
+        related: Dict[str, List[Dict[str, Any]]] = {node_id: [] for node_id in node_ids}
+        for row in await result.data():
+            related[row.pop("node_id")].append(row)
+        return related
+        
+    async def execute_cypher(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict]:
+        """Execute arbitrary Cypher query"""
+        async with self.driver.session() as session:
+            result = await session.run(query, parameters or {})
+            return await result.data()
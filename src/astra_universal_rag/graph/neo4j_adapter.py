@@ -6,41 +6,182 @@ Handles all interactions with the Neo4j graph database
 
 import os
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from neo4j import GraphDatabase, Driver, Transaction
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from neo4j import GraphDatabase, Driver, Session, Transaction
+from neo4j.exceptions import Neo4jError
 from ..schemas.universal_schema import GraphNode, GraphEdge, EntityType, RelationType
 
 logger = logging.getLogger(__name__)
 
+# Rows written per transaction by the bulk_* methods
+BULK_WRITE_BATCH_SIZE = 500
+# Rows committed per inner transaction by the load_csv_* methods
+LOAD_CSV_ROWS_PER_TRANSACTION = 10000
+
+# Secondary lookup keys indexed alongside the unique id of each label
+NATURAL_KEY_INDEXES = {
+    EntityType.COMMIT: "sha",
+    EntityType.FILE: "path",
+    EntityType.DEVELOPER: "name",
+}
+
+# Node pattern label suffixes and per-label bulk MERGE text, built once
+_LABELS: Dict[EntityType, str] = {entity_type: f":{entity_type}" for entity_type in EntityType}
+MERGE_NODE_TEMPLATES: Dict[EntityType, str] = {
+    entity_type: f"""
+        UNWIND $rows AS row
+        MERGE (n:{entity_type} {{id: row.id}})
+        SET n.vector_id = row.vector_id
+        SET n += row.properties
+        RETURN count(n) as created
+        """
+    for entity_type in EntityType
+}
+
+# One driver (and connection pool) per (uri, username) for the whole process
+_DRIVERS: Dict[Tuple[str, str], Driver] = {}
+_DRIVERS_LOCK = threading.Lock()
+# Per-key locks held while a driver is created and its schema ensured, so
+# that network IO never holds up adapters for other databases
+_DRIVER_KEY_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+def _driver_key_lock(key: Tuple[str, str]) -> threading.Lock:
+    with _DRIVERS_LOCK:
+        return _DRIVER_KEY_LOCKS.setdefault(key, threading.Lock())
+
+
+@lru_cache(maxsize=64)
+def _rel_query(rel_types: Tuple[str, ...], max_depth: int, start_label: str = "") -> str:
+    """
+    Traversal Cypher for a relationship set, depth and start label. Labels
+    and depth can't be parameters, so the text is built once per combination;
+    the stable text also lets Neo4j reuse its cached query plan. With a start
+    label the start node is found through that label's unique id index
+    rather than a scan of every node.
+    """
+    rel_pattern = "|".join(rel_types)
+    return f"""
+        UNWIND $node_ids AS node_id
+        MATCH path = (start{start_label} {{id: node_id}})-[:{rel_pattern}*1..{max_depth}]-(end)
+        WITH node_id, end, min(length(path)) as distance
+        RETURN node_id, end {{.id, .vector_id, .name, .path, .sha}} as node, distance
+        ORDER BY node_id, distance
+        """
+
+
+def close_all_drivers():
+    """Close every shared Neo4j driver, e.g. on application shutdown"""
+    with _DRIVERS_LOCK:
+        for driver in _DRIVERS.values():
+            driver.close()
+        _DRIVERS.clear()
+
 
 class Neo4jAdapter:
     """Adapter for Neo4j graph database operations"""
     
-    def __init__(self, uri: str, username: str, password: str):
+    def __init__(
+        self,
+        uri: str,
+        username: str,
+        password: str,
+        max_connection_pool_size: int = 50,
+        max_connection_lifetime: int = 3600,
+        connection_acquisition_timeout: float = 30.0
+    ):
         self.uri = uri
         self.username = username
         self.password = password
+        self.max_connection_pool_size = max_connection_pool_size
+        self.max_connection_lifetime = max_connection_lifetime
+        self.connection_acquisition_timeout = connection_acquisition_timeout
         self._driver: Optional[Driver] = None
         
     @property
     def driver(self) -> Driver:
-        """Lazy initialization of Neo4j driver"""
+        """Lazy lookup of the process-wide driver for this uri and user"""
         if self._driver is None:
-            self._driver = GraphDatabase.driver(
-                self.uri, 
-                auth=(self.username, self.password)
-            )
-            logger.info(f"Connected to Neo4j at {self.uri}")
+            key = (self.uri, self.username)
+            with _driver_key_lock(key):
+                driver = _DRIVERS.get(key)
+                if driver is None:
+                    driver = GraphDatabase.driver(
+                        self.uri, 
+                        auth=(self.username, self.password),
+                        max_connection_pool_size=self.max_connection_pool_size,
+                        max_connection_lifetime=self.max_connection_lifetime,
+                        connection_acquisition_timeout=self.connection_acquisition_timeout
+                    )
+                    logger.info(f"Connected to Neo4j at {self.uri}")
+                    try:
+                        self.ensure_schema(driver)
+                    except Exception:
+                        driver.close()
+                        raise
+                    with _DRIVERS_LOCK:
+                        _DRIVERS[key] = driver
+            self._driver = driver
         return self._driver
         
     def close(self):
-        """Close the Neo4j connection"""
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        """Release this adapter's handle; the shared driver stays open"""
+        self._driver = None
+            
+    @staticmethod
+    def ensure_schema(driver: Driver):
+        """
+        Create a unique id constraint (and its backing index) per entity
+        label, plus indexes on the natural keys of commits, files and
+        developers. Runs once per driver, before any ingestion writes.
+        
+        Graphs written before nodes were MERGEd by id can hold duplicate
+        ids, which makes the constraint fail; that is logged and the
+        adapter keeps working without it.
+        """
+        statements = [
+            f"CREATE CONSTRAINT {entity_type.value.lower()}_id_unique IF NOT EXISTS "
+            f"FOR (n:{entity_type.value}) REQUIRE n.id IS UNIQUE"
+            for entity_type in EntityType
+        ] + [
+            f"CREATE INDEX {entity_type.value.lower()}_{key} IF NOT EXISTS "
+            f"FOR (n:{entity_type.value}) ON (n.{key})"
+            for entity_type, key in NATURAL_KEY_INDEXES.items()
+        ]
+        failed = 0
+        with driver.session() as session:
+            for statement in statements:
+                try:
+                    session.run(statement).consume()
+                except Neo4jError as e:
+                    failed += 1
+                    logger.warning(
+                        f"Could not apply Neo4j schema ({statement}): {e}. "
+                        "Existing duplicate ids must be merged before the "
+                        "constraint can be created."
+                    )
+        logger.info(
+            f"Ensured Neo4j id constraints and natural key indexes "
+            f"({len(statements) - failed}/{len(statements)} applied)"
+        )
+        
+    @staticmethod
+    def _label(entity_type: Optional[EntityType]) -> str:
+        """Cypher label suffix for a node pattern, empty when the type is unknown"""
+        return _LABELS[entity_type] if entity_type else ""
+        
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Reuse one session for many operations: `with adapter.session() as s:`"""
+        with self.driver.session() as session:
+            yield session
             
     def create_node(self, node: GraphNode) -> str:
-        """Create a node in the graph"""
+        """Create or update a node in the graph, keyed by id"""
         with self.driver.session() as session:
             result = session.write_transaction(
                 self._create_node_tx, node
@@ -50,10 +191,8 @@ class Neo4jAdapter:
     @staticmethod
     def _create_node_tx(tx: Transaction, node: GraphNode) -> str:
         query = f"""
-        CREATE (n:{node.type.value} {{
-            id: $id,
-            vector_id: $vector_id
-        }})
+        MERGE (n:{node.type} {{id: $id}})
+        SET n.vector_id = $vector_id
         SET n += $properties
         RETURN n.id as id
         """
@@ -74,10 +213,12 @@ class Neo4jAdapter:
             
     @staticmethod
     def _create_edge_tx(tx: Transaction, edge: GraphEdge) -> bool:
+        source_label = Neo4jAdapter._label(edge.source_type)
+        target_label = Neo4jAdapter._label(edge.target_type)
         query = f"""
-        MATCH (a {{id: $source_id}})
-        MATCH (b {{id: $target_id}})
-        CREATE (a)-[r:{edge.type.value} {{weight: $weight}}]->(b)
+        MATCH (a{source_label} {{id: $source_id}})
+        MATCH (b{target_label} {{id: $target_id}})
+        CREATE (a)-[r:{edge.type} {{weight: $weight}}]->(b)
         SET r += $properties
         RETURN r
         """
@@ -90,45 +231,197 @@ class Neo4jAdapter:
         )
         return result.single() is not None
         
+    def bulk_create_nodes(
+        self,
+        nodes: List[GraphNode],
+        batch_size: int = BULK_WRITE_BATCH_SIZE
+    ) -> int:
+        """Merge many nodes on id with one UNWIND write per label and batch"""
+        by_type = sorted(nodes, key=lambda n: n.type)
+        created = 0
+        with self.session() as session:
+            for entity_type, group in groupby(by_type, key=lambda n: n.type):
+                rows = [
+                    {
+                        "id": n.id,
+                        "vector_id": n.vector_id,
+                        "properties": n.properties
+                    }
+                    for n in group
+                ]
+                for i in range(0, len(rows), batch_size):
+                    created += session.write_transaction(
+                        self._bulk_create_nodes_tx,
+                        entity_type,
+                        rows[i:i + batch_size]
+                    )
+        return created
+        
+    @staticmethod
+    def _bulk_create_nodes_tx(
+        tx: Transaction,
+        entity_type: EntityType,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        return tx.run(MERGE_NODE_TEMPLATES[entity_type], rows=rows).single()["created"]
+        
+    def bulk_create_edges(
+        self,
+        edges: List[GraphEdge],
+        batch_size: int = BULK_WRITE_BATCH_SIZE
+    ) -> int:
+        """MERGE many edges with one UNWIND write per relationship type and batch"""
+        def group_key(e: GraphEdge) -> Tuple[str, str, str]:
+            return (e.type, self._label(e.source_type), self._label(e.target_type))
+            
+        created = 0
+        with self.session() as session:
+            for (_, source_label, target_label), group in groupby(
+                sorted(edges, key=group_key), key=group_key
+            ):
+                group = list(group)
+                relation_type = group[0].type
+                rows = [
+                    {
+                        "source_id": e.source_id,
+                        "target_id": e.target_id,
+                        "weight": e.weight,
+                        "properties": e.properties
+                    }
+                    for e in group
+                ]
+                for i in range(0, len(rows), batch_size):
+                    created += session.write_transaction(
+                        self._bulk_create_edges_tx,
+                        relation_type,
+                        source_label,
+                        target_label,
+                        rows[i:i + batch_size]
+                    )
+        return created
+        
+    @staticmethod
+    def _bulk_create_edges_tx(
+        tx: Transaction,
+        relation_type: RelationType,
+        source_label: str,
+        target_label: str,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        query = f"""
+        UNWIND $rows AS row
+        MATCH (a{source_label} {{id: row.source_id}})
+        MATCH (b{target_label} {{id: row.target_id}})
+        MERGE (a)-[r:{relation_type}]->(b)
+        SET r.weight = row.weight, r += row.properties
+        RETURN count(r) as created
+        """
+        return tx.run(query, rows=rows).single()["created"]
+        
+    def load_csv_nodes(
+        self,
+        entity_type: EntityType,
+        url: str,
+        rows_per_transaction: int = LOAD_CSV_ROWS_PER_TRANSACTION
+    ):
+        """
+        MERGE nodes from a staged CSV (id, vector_id, properties JSON) that
+        the server reads itself. CALL {} IN TRANSACTIONS needs an implicit
+        transaction, so this uses session.run rather than a tx function.
+        """
+        query = f"""
+        LOAD CSV WITH HEADERS FROM $url AS row
+        CALL {{
+            WITH row
+            MERGE (n:{entity_type} {{id: row.id}})
+            SET n.vector_id = CASE row.vector_id WHEN '' THEN null ELSE row.vector_id END
+            SET n += apoc.convert.fromJsonMap(row.properties)
+        }} IN TRANSACTIONS OF {int(rows_per_transaction)} ROWS
+        """
+        with self.session() as session:
+            session.run(query, url=url).consume()
+            
+    def load_csv_edges(
+        self,
+        relation_type: RelationType,
+        source_type: Optional[EntityType],
+        target_type: Optional[EntityType],
+        url: str,
+        rows_per_transaction: int = LOAD_CSV_ROWS_PER_TRANSACTION
+    ):
+        """MERGE edges from a staged CSV (source_id, target_id, weight, properties JSON)"""
+        query = f"""
+        LOAD CSV WITH HEADERS FROM $url AS row
+        CALL {{
+            WITH row
+            MATCH (a{self._label(source_type)} {{id: row.source_id}})
+            MATCH (b{self._label(target_type)} {{id: row.target_id}})
+            MERGE (a)-[r:{relation_type}]->(b)
+            SET r.weight = toFloat(row.weight), r += apoc.convert.fromJsonMap(row.properties)
+        }} IN TRANSACTIONS OF {int(rows_per_transaction)} ROWS
+        """
+        with self.session() as session:
+            session.run(query, url=url).consume()
+            
     def find_related_nodes(
         self, 
         node_id: str, 
         relationship_types: List[RelationType],
-        max_depth: int = 2
+        max_depth: int = 2,
+        start_type: Optional[EntityType] = None
     ) -> List[Dict[str, Any]]:
         """Find all nodes related to a given node"""
+        return self.find_related_nodes_batch(
+            [node_id], relationship_types, max_depth, start_type
+        ).get(node_id, [])
+        
+    def find_related_nodes_batch(
+        self,
+        node_ids: List[str],
+        relationship_types: List[RelationType],
+        max_depth: int = 2,
+        start_type: Optional[EntityType] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find related nodes for many start nodes in a single round-trip.
+        Pass `start_type` when all start nodes share a known type.
+        """
+        if not node_ids:
+            return {}
         with self.driver.session() as session:
             return session.read_transaction(
-                self._find_related_nodes_tx,
-                node_id,
+                self._find_related_nodes_batch_tx,
+                node_ids,
                 relationship_types,
-                max_depth
+                max_depth,
+                start_type
             )
             
     @staticmethod
-    def _find_related_nodes_tx(
+    def _related_nodes_batch_query(
+        relationship_types: List[RelationType],
+        max_depth: int,
+        start_type: Optional[EntityType] = None
+    ) -> str:
+        rel_types = tuple(sorted({r.value for r in relationship_types}))
+        return _rel_query(rel_types, max_depth, Neo4jAdapter._label(start_type))
+        
+    @staticmethod
+    def _find_related_nodes_batch_tx(
         tx: Transaction,
-        node_id: str,
+        node_ids: List[str],
         relationship_types: List[RelationType],
-        max_depth: int
-    ) -> List[Dict[str, Any]]:
-        rel_types = "|".join([r.value for r in relationship_types])
-        query = f"""
-        MATCH path = (start {{id: $node_id}})-[:{rel_types}*1..{max_depth}]-(end)
-        RETURN DISTINCT end, length(path) as distance
-        ORDER BY distance
-        """
-        result = tx.run(query, node_id=node_id)
-        return [
-            {
-                "node": dict(record["end"]),
-                "distance": record["distance"]
-            }
-            for record in result
-        ]
+        max_depth: int,
+        start_type: Optional[EntityType] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        query = Neo4jAdapter._related_nodes_batch_query(relationship_types, max_depth, start_type)
+        result = tx.run(query, node_ids=list(node_ids))
+        related: Dict[str, List[Dict[str, Any]]] = {node_id: [] for node_id in node_ids}
+        for row in result.data():
+            related[row.pop("node_id")].append(row)
+        return related
         
     def execute_cypher(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict]:
         """Execute arbitrary Cypher query"""
         with self.driver.session() as session:
-            result = session.run(query, parameters or {})
-            return [dict(record) for record in result]
+            return session.run(query, parameters or {}).data()
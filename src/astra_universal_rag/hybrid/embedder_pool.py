@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Embedder Pool - Phase 1
+Coalesces concurrent query embeddings into batched model calls
+"""
+
+import asyncio
+import logging
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbedderPool:
+    """
+    Collects embedding requests for a short window and encodes them with a
+    single batched forward pass, off the event loop.
+    """
+
+    def __init__(self, model: Any, window_ms: float = 5.0, max_batch_size: int = 64):
+        self.model = model
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed one text, batched with any other requests in the window"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._start_batch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_batch)
+
+        return await future
+
+    def _start_batch(self):
+        self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        texts = [text for text, _ in batch]
+        try:
+            vectors = await asyncio.to_thread(
+                self.model.encode,
+                texts,
+                batch_size=len(texts),
+                convert_to_numpy=True
+            )
+        except Exception as e:
+            logger.error(f"Batched embedding of {len(texts)} queries failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
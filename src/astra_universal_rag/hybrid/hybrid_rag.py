@@ -5,15 +5,52 @@ Combines vector search (ChromaDB) with graph traversal (Neo4j) for enhanced retr
 """
 
 import asyncio
+import json
 import logging
+import threading
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from hashlib import blake2b
 from ..rag_system import AstraRAG
+from ..config_phase1 import get_phase1_settings
 from ..graph.neo4j_adapter import Neo4jAdapter
+from ..graph.async_neo4j_adapter import AsyncNeo4jAdapter
+from ..ingestion.batched_chroma_writer import BatchedChromaWriter
+from ..ingestion.dual_pipeline_ingestion import DualPipelineIngestion
 from ..schemas.universal_schema import EntityType, RelationType
+from .embedder_pool import EmbedderPool
+from .retrieval_disk_cache import RetrievalDiskCache
+from .semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
+# Relationships followed from vector hits into the graph
+SEARCH_RELATIONSHIP_TYPES = [
+    RelationType.MODIFIES,
+    RelationType.AUTHORED_BY,
+    RelationType.FIXES,
+    RelationType.TESTS
+]
+
+
+@dataclass
+class VectorHit:
+    """One vector store match"""
+    content: str
+    metadata: Dict[str, Any]
+    similarity: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class VectorSearchResults:
+    """Vector matches for a query, best first"""
+    results: List[VectorHit]
+    intent: str
+    confidence_score: float
+
 
 @dataclass
 class HybridSearchResult:
@@ -33,12 +70,172 @@ class HybridRAG(AstraRAG):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.graph_adapter: Optional[Neo4jAdapter] = None
+        self.async_graph_adapter: Optional[AsyncNeo4jAdapter] = None
+        self.phase1_settings = get_phase1_settings()
+        self.graph_weight = self.phase1_settings.graph_weight
+        self.vector_weight = self.phase1_settings.vector_weight
+        self._semantic_caches: Dict[Tuple[str, int, int], SemanticCache] = {}
+        self._embedder_pool: Optional[EmbedderPool] = None
+        self._chunk_writer: Optional[BatchedChromaWriter] = None
+        # Opened on the first search, so constructing the system touches no files
+        self._disk_cache: Optional[RetrievalDiskCache] = None
+        # Set when the corpus changes before the disk cache is opened
+        self._disk_cache_stale = False
+        self._disk_cache_lock = threading.Lock()
+        # Bumped on every corpus change; searches that started before it
+        # don't cache their (possibly stale) results
+        self._cache_generation = 0
         
     def initialize_graph(self, uri: str, username: str, password: str):
         """Initialize the graph database connection"""
-        self.graph_adapter = Neo4jAdapter(uri, username, password)
+        pool_options = {
+            "max_connection_pool_size": self.phase1_settings.neo4j_max_connection_pool_size,
+            "max_connection_lifetime": self.phase1_settings.neo4j_max_connection_lifetime,
+            "connection_acquisition_timeout": self.phase1_settings.neo4j_connection_acquisition_timeout
+        }
+        self.graph_adapter = Neo4jAdapter(uri, username, password, **pool_options)
+        # Reads on the search path go through the async driver so they
+        # don't block the event loop
+        self.async_graph_adapter = AsyncNeo4jAdapter(uri, username, password, **pool_options)
         logger.info("Initialized graph adapter for hybrid RAG")
         
+    async def ingest_repository(
+        self,
+        repo_path: str,
+        repo_url: str,
+        bulk: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Ingest a repository into both the vector store and the graph. With
+        `bulk`, graph writes are staged as CSV and loaded through LOAD CSV,
+        which suits the first ingestion of a large repository.
+        """
+        if self.graph_adapter is None:
+            raise RuntimeError("Graph adapter not initialized; call initialize_graph first")
+        ingestion = DualPipelineIngestion(
+            vector_store=self,
+            graph_adapter=self.graph_adapter
+        )
+        try:
+            if bulk:
+                return await asyncio.to_thread(
+                    ingestion.ingest_repository_bulk, repo_path, repo_url
+                )
+            return await ingestion.ingest_repository_async(repo_path, repo_url)
+        finally:
+            self.flush_chunks()
+            self.clear_caches()
+            
+    async def index_documentation(self, *args, **kwargs) -> Dict[str, Any]:
+        """Index documentation, then drop search results cached from the old corpus"""
+        try:
+            return await super().index_documentation(*args, **kwargs)
+        finally:
+            self.clear_caches()
+            
+    async def _add_chunks_to_collection(self, chunks: List[Dict[str, Any]]):
+        """Add indexer chunks, then drop search results cached from the old corpus"""
+        try:
+            await super()._add_chunks_to_collection(chunks)
+        finally:
+            self.clear_caches()
+            
+    def clear_caches(self):
+        """
+        Invalidate cached search results after the corpus changes. Called
+        from ingestion threads, so the semantic caches are swapped out
+        rather than mutated, and searches already in flight are kept from
+        storing their results by the generation counters.
+        """
+        self._cache_generation += 1
+        self._semantic_caches = {}
+        with self._disk_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.clear()
+            else:
+                self._disk_cache_stale = True
+            
+    @property
+    def disk_cache(self) -> Optional[RetrievalDiskCache]:
+        """The on-disk retrieval cache, opened on first use; None when disabled"""
+        if self._disk_cache is None and self.phase1_settings.retrieval_disk_cache_enabled:
+            with self._disk_cache_lock:
+                if self._disk_cache is None:
+                    disk_cache = RetrievalDiskCache(
+                        self.phase1_settings.retrieval_disk_cache_path,
+                        ttl_seconds=self.phase1_settings.retrieval_disk_cache_ttl_seconds
+                    )
+                    if self._disk_cache_stale:
+                        # Results stored by an earlier run predate this corpus change
+                        disk_cache.clear()
+                        self._disk_cache_stale = False
+                    self._disk_cache = disk_cache
+        return self._disk_cache
+            
+    def flush_chunks(self):
+        """Write any chunks still buffered by add_chunk"""
+        if self._chunk_writer is not None:
+            self._chunk_writer.flush()
+            
+    @staticmethod
+    def _chunk_record(chunk: Any) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Chroma id, document and scalar-only metadata for a code chunk. A
+        chunker can emit several chunks for one node with the same line
+        range, so the id carries a content hash; reruns still upsert in place.
+        """
+        metadata = {
+            key: value if isinstance(value, (str, int, float, bool)) else str(value)
+            for key, value in chunk.metadata.items()
+            if value is not None
+        }
+        chunk_id = (
+            f"{chunk.metadata.get('graph_node_id', 'chunk')}:"
+            f"{chunk.start_line}-{chunk.end_line}:"
+            f"{blake2b(chunk.content.encode('utf-8'), digest_size=8).hexdigest()}"
+        )
+        return chunk_id, chunk.content, metadata
+        
+    def _get_chunk_writer(self) -> BatchedChromaWriter:
+        if self._chunk_writer is None or self._chunk_writer.collection is not self.collection:
+            self._chunk_writer = BatchedChromaWriter(
+                self.collection, self.embedding_model, on_flush=self.clear_caches
+            )
+        return self._chunk_writer
+        
+    def add_chunk(self, chunk: Any):
+        """Queue a code chunk for the vector collection, keyed by its graph node"""
+        self._get_chunk_writer().add_one(*self._chunk_record(chunk))
+        
+    def add_chunks(self, chunks: List[Any]):
+        """Embed and upsert a batch of code chunks in one collection write"""
+        writer = self._get_chunk_writer()
+        for chunk in chunks:
+            writer.add_one(*self._chunk_record(chunk))
+        writer.flush()
+        
+    @property
+    def embedder_pool(self) -> EmbedderPool:
+        """Batches concurrent query embeddings into one model call"""
+        if self._embedder_pool is None or self._embedder_pool.model is not self.embedding_model:
+            self._embedder_pool = EmbedderPool(self.embedding_model)
+        return self._embedder_pool
+        
+    def _get_semantic_cache(self, cache_key: Tuple[str, int, int]) -> Optional[SemanticCache]:
+        """Get the semantic cache for a search configuration, if caching is possible"""
+        if not self.phase1_settings.semantic_cache_enabled or self.embedding_model is None:
+            return None
+        cache = self._semantic_caches.get(cache_key)
+        if cache is None:
+            cache = SemanticCache(
+                dimension=self.embedding_model.get_sentence_embedding_dimension(),
+                similarity_threshold=self.phase1_settings.semantic_cache_threshold,
+                max_entries=self.phase1_settings.semantic_cache_max_entries,
+                ttl_seconds=self.phase1_settings.semantic_cache_ttl_seconds
+            )
+            self._semantic_caches[cache_key] = cache
+        return cache
+        
     async def hybrid_search(
         self,
         query: str,
@@ -53,38 +250,100 @@ class HybridRAG(AstraRAG):
         2. Use top results to find entry points in graph
         3. Traverse graph for additional context
         4. Combine and rank results
+        
+        Repeated queries are answered from the on-disk cache, and
+        near-identical ones from the semantic cache.
         """
-        # Step 1: Vector search for semantic similarity
+        generation = self._cache_generation
+        disk_cache = self.disk_cache
+        disk_key = disk_generation = None
+        if disk_cache is not None:
+            disk_generation = disk_cache.generation
+            disk_key = RetrievalDiskCache.make_key(
+                query, intent or "general", max_vector_results, max_graph_depth,
+                {"graph_weight": self.graph_weight, "vector_weight": self.vector_weight},
+                collection_name=self.collection.name,
+                graph_uri=self.graph_adapter.uri if self.graph_adapter else None
+            )
+            stored = await asyncio.to_thread(disk_cache.get, disk_key)
+            if stored is not None:
+                return HybridSearchResult(**stored)
+                
+        cache = self._get_semantic_cache(
+            (intent or "general", max_vector_results, max_graph_depth)
+        )
+        query_embedding = None
+        if cache is not None:
+            query_embedding = await self.embedder_pool.embed(query)
+            cached = cache.get(query_embedding)
+            if cached is not None:
+                return cached
+        
+        # Step 1: Vector search for semantic similarity, reusing the
+        # embedding computed for the cache lookup
         vector_results = await self.search_with_intent(
             query=query,
             intent=intent or "general",
-            top_k=max_vector_results
+            top_k=max_vector_results,
+            query_embedding=query_embedding
         )
         
         # Step 2: Extract graph node IDs from vector results
         graph_entry_points = []
+        entry_types: Dict[str, Optional[str]] = {}
+        stored_neighbors = {}
         for result in vector_results.results[:3]:  # Top 3 as entry points
-            if result.metadata.get("graph_node_id"):
-                graph_entry_points.append(result.metadata["graph_node_id"])
+            node_id = result.metadata.get("graph_node_id")
+            if node_id:
+                graph_entry_points.append(node_id)
+                # Absent on chunks ingested before node types were recorded
+                entry_types[node_id] = result.metadata.get("graph_node_type")
+                # Only complete lists can stand in for the traversal
+                if result.metadata.get("graph_neighbors_truncated") is False:
+                    stored_neighbors[node_id] = json.loads(result.metadata["graph_neighbors"])
                 
         # Step 3: Graph traversal from entry points
         graph_context = {}
         reasoning_path = []
         
-        if self.graph_adapter and graph_entry_points:
+        if (
+            graph_entry_points
+            and max_graph_depth <= 1
+            and all(node_id in stored_neighbors for node_id in graph_entry_points)
+        ):
+            # Depth-1 neighbours were denormalized at ingest, with the same
+            # projection the traversal returns; skip the graph
             for node_id in graph_entry_points:
-                # Find related commits, files, and developers
-                related = self.graph_adapter.find_related_nodes(
-                    node_id=node_id,
-                    relationship_types=[
-                        RelationType.MODIFIES,
-                        RelationType.AUTHORED_BY,
-                        RelationType.FIXES,
-                        RelationType.TESTS
-                    ],
-                    max_depth=max_graph_depth
+                related = [
+                    {"node": neighbor, "distance": 1}
+                    for neighbor in stored_neighbors[node_id]
+                ]
+                graph_context[node_id] = related
+                reasoning_path.append(
+                    f"Found {len(related)} related nodes from {node_id} (ingest metadata)"
                 )
                 
+        elif self.async_graph_adapter and graph_entry_points:
+            # Find related commits, files, and developers with one concurrent
+            # traversal per start node type, so each can match on its label
+            ids_by_type: Dict[Optional[str], List[str]] = {}
+            for node_id in graph_entry_points:
+                ids_by_type.setdefault(entry_types[node_id], []).append(node_id)
+            batches = await asyncio.gather(*(
+                self.async_graph_adapter.find_related_nodes_batch(
+                    node_ids=node_ids,
+                    relationship_types=SEARCH_RELATIONSHIP_TYPES,
+                    max_depth=max_graph_depth,
+                    start_type=EntityType(node_type) if node_type else None
+                )
+                for node_type, node_ids in ids_by_type.items()
+            ))
+            related_by_node = {}
+            for batch in batches:
+                related_by_node.update(batch)
+            
+            for node_id in graph_entry_points:
+                related = related_by_node.get(node_id, [])
                 graph_context[node_id] = related
                 reasoning_path.append(
                     f"Found {len(related)} related nodes from {node_id}"
@@ -95,12 +354,56 @@ class HybridRAG(AstraRAG):
             vector_results, graph_context
         )
         
-        return HybridSearchResult(
+        result = HybridSearchResult(
             vector_results=[r.to_dict() for r in vector_results.results],
             graph_context=graph_context,
             combined_score=combined_score,
             reasoning_path=reasoning_path
         )
+        if cache is not None and generation == self._cache_generation:
+            cache.put(query_embedding, result)
+        if disk_key is not None:
+            # The SQLite write and commit stay off the event loop; the disk
+            # cache drops the result if it was cleared while we searched
+            await asyncio.to_thread(disk_cache.put, disk_key, result, disk_generation)
+        return result
+        
+    async def search_with_intent(
+        self,
+        query: str,
+        intent: str = "general",
+        top_k: int = 10,
+        query_embedding: Optional[Any] = None
+    ) -> VectorSearchResults:
+        """
+        Vector search for hybrid_search. A precomputed `query_embedding` is
+        used as is; otherwise the collection embeds the query text.
+        """
+        if query_embedding is not None:
+            query_kwargs = {"query_embeddings": [list(map(float, query_embedding))]}
+        else:
+            query_kwargs = {"query_texts": [query]}
+        results = await asyncio.to_thread(
+            self.collection.query, n_results=top_k, **query_kwargs
+        )
+        
+        hits = []
+        if results["documents"] and results["documents"][0]:
+            metadatas = results["metadatas"][0] if results["metadatas"] else None
+            distances = results["distances"][0] if results["distances"] else None
+            for i, document in enumerate(results["documents"][0]):
+                distance = distances[i] if distances else 0
+                hits.append(VectorHit(
+                    content=document,
+                    metadata=(metadatas[i] or {}) if metadatas else {},
+                    # Same normalisation of cosine distance as AstraRAG.search
+                    similarity=max(0, 1 - (distance / 2.0))
+                ))
+                
+        confidence_score = sum(h.similarity for h in hits) / len(hits) if hits else 0.0
+        return VectorSearchResults(
+            results=hits, intent=intent, confidence_score=confidence_score
+        )
         
     def _calculate_combined_score(
         self,
@@ -108,9 +411,8 @@ class HybridRAG(AstraRAG):
         graph_context: Dict[str, Any]
     ) -> float:
         """Calculate combined relevance score"""
-        # Simple weighted combination for now
+        # Weighted combination, weights from Phase1Settings
         vector_score = vector_results.confidence_score if hasattr(vector_results, 'confidence_score') else 0.5
         graph_score = min(1.0, len(graph_context) / 10.0) if graph_context else 0.0
         
-        # 70% vector, 30% graph
-        return 0.7 * vector_score + 0.3 * graph_score
+        return self.vector_weight * vector_score + self.graph_weight * graph_score
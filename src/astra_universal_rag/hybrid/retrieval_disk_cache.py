@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Retrieval Disk Cache - Phase 1
+Persists hybrid search results across restarts, keyed by query and config
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import asdict
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape or scoring of cached results changes
+CONFIG_VERSION = 1
+
+
+class RetrievalDiskCache:
+    """SQLite-backed exact-match cache of serialized HybridSearchResults"""
+
+    def __init__(self, path: Path, ttl_seconds: float = 86400.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # Bumped by clear(); a put computed before a clear is dropped
+        self.generation = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # A lost cache write only costs a recomputation; skip per-commit fsyncs
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS retrieval_cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        query: str,
+        intent: str,
+        max_vector_results: int,
+        max_graph_depth: int,
+        config: Dict[str, Any],
+        collection_name: str,
+        graph_uri: Optional[str]
+    ) -> str:
+        """
+        Stable key over the query, search parameters, scoring config and the
+        collection and graph searched, so stores sharing one cache file
+        never see each other's results
+        """
+        config_part = json.dumps(config, sort_keys=True)
+        raw = (
+            f"{query}|{intent}|{max_vector_results}|{max_graph_depth}|"
+            f"{CONFIG_VERSION}|{config_part}|{collection_name}|{graph_uri or ''}"
+        )
+        return blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result fields, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM retrieval_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+        return json.loads(value)
+
+    def put(self, key: str, result: Any, generation: Optional[int] = None):
+        """
+        Store a result dataclass. Pass the `generation` read before the
+        result was computed: if the cache was cleared since, the result may
+        predate the corpus change and is not stored.
+        """
+        value = json.dumps(asdict(result), default=str)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO retrieval_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Drop all cached results, e.g. after the corpus changes"""
+        with self._lock:
+            self.generation += 1
+            self._conn.execute("DELETE FROM retrieval_cache")
+            self._conn.commit()
+        logger.debug("Cleared retrieval disk cache")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
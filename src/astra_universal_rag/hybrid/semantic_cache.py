@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Semantic Query Cache - Phase 1
+Caches hybrid search results keyed by query embedding similarity
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    In-process cache for near-identical queries.
+
+    Embeddings are bucketed with L tables of K random-projection sign bits
+    (LSH), so a lookup only compares against the handful of entries that
+    share a bucket, then confirms with a cosine-similarity threshold.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        similarity_threshold: float = 0.95,
+        num_tables: int = 4,
+        num_bits: int = 12,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        seed: int = 42,
+    ):
+        self.dimension = dimension
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        rng = np.random.default_rng(seed)
+        # One (num_bits x dimension) hyperplane matrix per hash table
+        self._planes = rng.standard_normal((num_tables, num_bits, dimension)).astype(np.float32)
+        self._bit_weights = 1 << np.arange(num_bits, dtype=np.int64)
+
+        # entry_id -> [vec, result, ts, hits, bucket_keys]; order is LRU order
+        self._entries: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._next_id = 0
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _normalize(self, embedding: Any) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def _bucket_keys(self, vec: np.ndarray) -> List[Tuple[int, int]]:
+        bits = (self._planes @ vec) > 0  # (num_tables, num_bits)
+        codes = bits.astype(np.int64) @ self._bit_weights
+        return [(table, int(code)) for table, code in enumerate(codes)]
+
+    def _evict(self, entry_id: int):
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        for key in entry[4]:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(entry_id)
+            except ValueError:
+                pass
+            if not bucket:
+                del self._buckets[key]
+
+    def get(self, embedding: Any) -> Optional[Any]:
+        """Return a cached result for a similar query, or None on miss"""
+        vec = self._normalize(embedding)
+        now = time.monotonic()
+
+        best_id, best_sim = None, self.similarity_threshold
+        seen = set()
+        for key in self._bucket_keys(vec):
+            for entry_id in self._buckets.get(key, ()):
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                sim = float(np.dot(vec, self._entries[entry_id][0]))
+                if sim >= best_sim:
+                    best_id, best_sim = entry_id, sim
+
+        if best_id is not None:
+            entry = self._entries[best_id]
+            if now - entry[2] > self.ttl_seconds:
+                self._evict(best_id)
+            else:
+                entry[3] += 1
+                self._entries.move_to_end(best_id)
+                self.cache_hits += 1
+                return entry[1]
+
+        self.cache_misses += 1
+        return None
+
+    def put(self, embedding: Any, result: Any):
+        """Insert a result, evicting the least recently used entry if full"""
+        vec = self._normalize(embedding)
+        keys = self._bucket_keys(vec)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = [vec, result, time.monotonic(), 0, keys]
+        for key in keys:
+            self._buckets.setdefault(key, []).append(entry_id)
+
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for observability"""
+        total = self.cache_hits + self.cache_misses
+        return {
+            "entries": len(self._entries),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "hit_rate": self.cache_hits / total if total else 0.0,
+        }
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Batched ChromaDB Writer - Phase 1
+Accumulates vector store writes and flushes them as bulk upserts
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedChromaWriter:
+    """
+    Buffers documents and writes them to a ChromaDB collection in batches,
+    embedding each batch with one batched forward pass of the model.
+    """
+
+    def __init__(
+        self,
+        collection,
+        embedding_model=None,
+        batch_size: int = 256,
+        on_flush: Optional[Callable[[], None]] = None
+    ):
+        self.collection = collection
+        self.embedding_model = embedding_model
+        self.batch_size = batch_size
+        # Called after every upsert, e.g. to invalidate search caches
+        self.on_flush = on_flush
+        # id -> (document, metadata); a later write to the same id wins
+        self._buffer: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self.written = 0
+
+    def add_one(self, doc_id: str, document: str, metadata: Optional[Dict[str, Any]] = None):
+        """Queue one document, flushing when the batch is full"""
+        self._buffer[doc_id] = (document, metadata or {})
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all queued documents in a single upsert"""
+        if not self._buffer:
+            return
+        ids = list(self._buffer)
+        documents = [self._buffer[i][0] for i in ids]
+        metadatas = [self._buffer[i][1] for i in ids]
+        self._buffer = {}
+
+        kwargs = {}
+        if self.embedding_model is not None:
+            kwargs["embeddings"] = self.embedding_model.encode(
+                documents, batch_size=64, convert_to_numpy=True
+            ).tolist()
+
+        self.collection.upsert(ids=ids, documents=documents, metadatas=metadatas, **kwargs)
+        self.written += len(ids)
+        logger.debug(f"Flushed {len(ids)} documents to ChromaDB")
+        if self.on_flush is not None:
+            self.on_flush()
+
+    def close(self):
+        """Flush any remaining documents"""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
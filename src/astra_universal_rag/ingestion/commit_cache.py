@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Commit Cache - Phase 1
+Stores extracted commits either as one JSON file each or in a single SQLite file
+"""
+
+import logging
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Commit files are small, so JSON reads and writes are syscall-bound
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+WRITE_BATCH_SIZE = 512
+# Parsed commit files kept in memory between ingestion runs
+PARSED_FILE_CACHE_SIZE = 16384
+# Log write progress every this many commits
+PROGRESS_EVERY = 1000
+
+SQLITE_FILENAME = "commits.db"
+
+
+class CommitCache(ABC):
+    """Where extracted commits are written to and read back from"""
+
+    @abstractmethod
+    def write_many(self, commits: Iterable[Dict[str, Any]]) -> int:
+        """Store commits, returning how many were written"""
+        pass
+
+    @abstractmethod
+    def iter_commits(self) -> Iterator[Dict[str, Any]]:
+        """Yield every cached commit"""
+        pass
+
+
+class JsonDirBackend(CommitCache):
+    """One commit_<hash>.json per commit, the layout other readers expect"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def paths(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob("*.json"))
+
+    def write_many(self, commits: Iterable[Dict[str, Any]]) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        commits = iter(commits)
+        count = 0
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            # Encode and write a bounded batch at a time so a streamed
+            # history is never held in memory all at once
+            for batch in iter(lambda: list(islice(commits, WRITE_BATCH_SIZE)), []):
+                paths = [self.directory / f"commit_{commit['hash']}.json" for commit in batch]
+                payloads = [orjson.dumps(commit, option=orjson.OPT_INDENT_2) for commit in batch]
+                for _ in executor.map(Path.write_bytes, paths, payloads):
+                    count += 1
+                    if count % PROGRESS_EVERY == 0:
+                        logger.info(f"Cached {count} commits in {self.directory}")
+        return count
+
+    def iter_commits(self) -> Iterator[Dict[str, Any]]:
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            yield from executor.map(load_commit_file, self.paths())
+
+
+class SqliteBackend(CommitCache):
+    """All commits in one SQLite file, written in a single transaction"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS commits (hash TEXT PRIMARY KEY, json BLOB NOT NULL)"
+        )
+        return conn
+
+    def write_many(self, commits: Iterable[Dict[str, Any]]) -> int:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        count = 0
+        try:
+            conn.execute("BEGIN")
+            for commit in commits:
+                conn.execute(
+                    "INSERT OR REPLACE INTO commits (hash, json) VALUES (?, ?)",
+                    (commit["hash"], orjson.dumps(commit))
+                )
+                count += 1
+                if count % PROGRESS_EVERY == 0:
+                    logger.info(f"Cached {count} commits in {self.path}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return count
+
+    def iter_commits(self) -> Iterator[Dict[str, Any]]:
+        if not self.path.exists():
+            return
+        conn = self._connect()
+        try:
+            for (data,) in conn.execute("SELECT json FROM commits"):
+                yield orjson.loads(data)
+        finally:
+            conn.close()
+
+
+def open_commit_cache(directory: Path, backend: str = "json") -> CommitCache:
+    """Cache rooted at `directory` in the `backend` format, e.g. for writing"""
+    directory = Path(directory)
+    if backend == "sqlite":
+        return SqliteBackend(directory / SQLITE_FILENAME)
+    if backend != "json":
+        raise ValueError(f"Unknown commit cache backend: {backend}")
+    return JsonDirBackend(directory)
+
+
+def find_commit_cache(directory: Path) -> CommitCache:
+    """
+    Cache to read from in `directory`: whichever format was written there
+    most recently, so a cache left behind by an earlier backend setting
+    never shadows fresher commits. Warns when both formats are present.
+    """
+    directory = Path(directory)
+    json_cache = JsonDirBackend(directory)
+    sqlite_cache = SqliteBackend(directory / SQLITE_FILENAME)
+    if not sqlite_cache.path.exists():
+        return json_cache
+    json_paths = json_cache.paths()
+    if not json_paths:
+        return sqlite_cache
+    # Recent writes may still sit in the WAL file rather than the database
+    sqlite_files = [sqlite_cache.path, sqlite_cache.path.with_name(SQLITE_FILENAME + "-wal")]
+    sqlite_written = max(path.stat().st_mtime_ns for path in sqlite_files if path.exists())
+    json_written = max(path.stat().st_mtime_ns for path in json_paths)
+    newest = sqlite_cache if sqlite_written >= json_written else json_cache
+    logger.warning(
+        f"Both JSON and SQLite commit caches found in {directory}; reading the "
+        f"more recently written {'SQLite' if newest is sqlite_cache else 'JSON'} one"
+    )
+    return newest
+
+
+def load_commit_file(path: Path) -> Dict[str, Any]:
+    """Parse one JSON commit file, reusing the result while it is unchanged"""
+    return _parse_commit_file(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=PARSED_FILE_CACHE_SIZE)
+def _parse_commit_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
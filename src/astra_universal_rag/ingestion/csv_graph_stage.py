@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+CSV Graph Stage - Phase 1
+Stages graph nodes and edges as CSV files for Neo4j LOAD CSV bulk import
+"""
+
+import csv
+import logging
+from pathlib import Path
+from typing import Dict, IO, List, Optional, Tuple
+
+import orjson
+
+from ..schemas.universal_schema import GraphNode, GraphEdge, EntityType, RelationType
+
+logger = logging.getLogger(__name__)
+
+NODE_HEADER = ["id", "vector_id", "properties"]
+EDGE_HEADER = ["source_id", "target_id", "weight", "properties"]
+
+EdgeKey = Tuple[RelationType, Optional[EntityType], Optional[EntityType]]
+
+
+class CsvGraphStage:
+    """
+    Appends nodes to one CSV per label and edges to one CSV per
+    (relationship, source label, target label). Properties are stored as a
+    JSON column, so every file of a kind shares the same header.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._files: List[IO[str]] = []
+        self._node_writers: Dict[EntityType, "csv._writer"] = {}
+        self._edge_writers: Dict[EdgeKey, "csv._writer"] = {}
+        self.node_files: Dict[EntityType, Path] = {}
+        self.edge_files: Dict[EdgeKey, Path] = {}
+
+    def _open(self, name: str, header: List[str]) -> Tuple[Path, "csv._writer"]:
+        path = self.directory / name
+        f = open(path, "w", newline="", encoding="utf-8")
+        self._files.append(f)
+        writer = csv.writer(f)
+        writer.writerow(header)
+        return path, writer
+
+    def write_nodes(self, entity_type: EntityType, nodes: List[GraphNode]):
+        writer = self._node_writers.get(entity_type)
+        if writer is None:
+            path, writer = self._open(f"nodes_{entity_type.lower()}.csv", NODE_HEADER)
+            self.node_files[entity_type] = path
+            self._node_writers[entity_type] = writer
+        writer.writerows(
+            (n.id, n.vector_id or "", orjson.dumps(n.properties).decode())
+            for n in nodes
+        )
+
+    def write_edges(self, edges: List[GraphEdge]):
+        for edge in edges:
+            key = (edge.type, edge.source_type, edge.target_type)
+            writer = self._edge_writers.get(key)
+            if writer is None:
+                parts = [edge.type.lower()] + [
+                    label.lower() if label else "any" for label in key[1:]
+                ]
+                path, writer = self._open(f"edges_{'_'.join(parts)}.csv", EDGE_HEADER)
+                self.edge_files[key] = path
+                self._edge_writers[key] = writer
+            writer.writerow((
+                edge.source_id,
+                edge.target_id,
+                edge.weight,
+                orjson.dumps(edge.properties).decode()
+            ))
+
+    def close(self):
+        """Flush and close every staged file"""
+        for f in self._files:
+            f.close()
+        self._files = []
+        logger.info(
+            f"Staged {len(self.node_files)} node and {len(self.edge_files)} edge CSV files "
+            f"in {self.directory}"
+        )
@@ -4,16 +4,57 @@ Dual Pipeline Ingestion - Phase 1
 Populates both ChromaDB (vectors) and Neo4j (graph) during ingestion
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import multiprocessing
+import os
+import shutil
+import uuid
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import DefaultDict, Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 from pathlib import Path
+
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+from ..config import get_rag_config
+from ..config_phase1 import get_phase1_settings
 from ..graph.neo4j_adapter import Neo4jAdapter
 from ..schemas.universal_schema import GraphNode, GraphEdge, EntityType, RelationType
-from ..code_aware_chunker import CodeAwareChunker
+from ..code_aware_chunker import ChunkType, CodeAwareChunker
+from .commit_cache import JsonDirBackend, find_commit_cache, load_commit_file
+from .csv_graph_stage import CsvGraphStage
 
 logger = logging.getLogger(__name__)
 
+# Depth-1 neighbours denormalized onto each chunk's vector metadata; longer
+# lists are cut and flagged as truncated so search asks the graph instead
+GRAPH_NEIGHBORS_LIMIT = 10
+
+# Commit cache files loaded concurrently
+COMMIT_CONCURRENCY = 16
+# Buffered graph writes (nodes + edges) that trigger a batched MERGE flush
+GRAPH_BATCH_SIZE = 1000
+# Source files handed to each chunking worker process
+FILE_CHUNK_BATCH_SIZE = 50
+# Vector chunks embedded and written per add_chunks call
+CHUNK_BATCH_SIZE = 256
+
+# Source paths (relative, POSIX-style) left out of ingestion: test files,
+# and anything under test, cache, virtualenv or vendored directories
+_SKIP_RE = _re.compile(
+    r"(?i)(^|/)(tests?|__pycache__|\.venv|venv|node_modules)(/|$)|test[^/]*$"
+)
+
+NodeBuffer = DefaultDict[EntityType, List[GraphNode]]
+EdgeBuffer = DefaultDict[RelationType, List[GraphEdge]]
+# (file node, function/class nodes, vector chunks, error message)
+FileChunks = Tuple[GraphNode, List[GraphNode], List[Any], Optional[str]]
+
 
 class DualPipelineIngestion:
     """Handles ingestion into both vector and graph databases"""
@@ -21,22 +62,31 @@ class DualPipelineIngestion:
     def __init__(self, vector_store, graph_adapter: Neo4jAdapter):
         self.vector_store = vector_store
         self.graph_adapter = graph_adapter
-        self.chunker = CodeAwareChunker()
+        self.chunker = CodeAwareChunker(get_rag_config())
+        # file node id -> neighbour projections of commits that modified it
+        self._file_commits: Dict[str, List[Dict[str, Any]]] = {}
+        # Developer/file node ids already buffered this run; edges still
+        # repeat per commit, and the MERGE keeps reruns idempotent
+        self._seen_devs: Set[str] = set()
+        self._seen_files: Set[str] = set()
+        # Pending graph writes, grouped so each flush is one homogeneous UNWIND
+        self._node_buffer: NodeBuffer = defaultdict(list)
+        self._edge_buffer: EdgeBuffer = defaultdict(list)
+        self._buffered = 0
+        # Pending vector store writes
+        self._chunk_buffer: List[Any] = []
+        # Set during bulk ingestion: graph flushes go to CSV instead of Neo4j
+        self._csv_stage: Optional[CsvGraphStage] = None
         
     def ingest_repository(self, repo_path: str, repo_url: str) -> Dict[str, Any]:
         """Ingest a Git repository into both databases"""
         repo_path = Path(repo_path)
+        self._file_commits = {}
+        self._seen_devs = set()
+        self._seen_files = set()
         
         # Create repository node in graph
-        repo_node = GraphNode(
-            id=f"repo:{repo_url}",
-            type=EntityType.REPOSITORY,
-            properties={
-                "url": repo_url,
-                "path": str(repo_path),
-                "name": repo_path.name
-            }
-        )
+        repo_node = self._repository_node(repo_path, repo_url)
         self.graph_adapter.create_node(repo_node)
         
         # Process commits
@@ -45,164 +95,520 @@ class DualPipelineIngestion:
         # Process files
         files_ingested = self._ingest_files(repo_path, repo_node.id)
         
+        self._flush_all()
+        self._flush_chunks()
         return {
             "repository": repo_url,
             "commits_ingested": commits_ingested,
             "files_ingested": files_ingested
         }
         
+    async def ingest_repository_async(self, repo_path: str, repo_url: str) -> Dict[str, Any]:
+        """Ingest a Git repository, overlapping commit loading with graph writes"""
+        repo_path = Path(repo_path)
+        self._file_commits = {}
+        self._seen_devs = set()
+        self._seen_files = set()
+        
+        repo_node = self._repository_node(repo_path, repo_url)
+        await asyncio.to_thread(self.graph_adapter.create_node, repo_node)
+        
+        commits_ingested = await self._ingest_commits_async(repo_path, repo_node.id)
+        files_ingested = await asyncio.to_thread(self._ingest_files, repo_path, repo_node.id)
+        
+        await asyncio.to_thread(self._flush_all)
+        await asyncio.to_thread(self._flush_chunks)
+        return {
+            "repository": repo_url,
+            "commits_ingested": commits_ingested,
+            "files_ingested": files_ingested
+        }
+        
+    def ingest_repository_bulk(
+        self,
+        repo_path: str,
+        repo_url: str,
+        import_dir: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """
+        First-time ingestion of a large repository through LOAD CSV. Graph
+        writes are staged as CSV files in Neo4j's import directory
+        (`import_dir`, as seen from this host) and loaded server-side in
+        batched transactions; vector chunks are written as usual.
+        """
+        import_dir = Path(import_dir or get_phase1_settings().neo4j_import_dir)
+        stage_name = f"ingest_{uuid.uuid4().hex}"
+        stage = CsvGraphStage(import_dir / stage_name)
+        try:
+            self._csv_stage = stage
+            try:
+                result = self.ingest_repository(repo_path, repo_url)
+            finally:
+                self._csv_stage = None
+                stage.close()
+                
+            # Nodes first so the edge MATCHes can find both endpoints
+            for entity_type, path in stage.node_files.items():
+                self.graph_adapter.load_csv_nodes(
+                    entity_type, f"file:///{stage_name}/{path.name}"
+                )
+            for (relation_type, source_type, target_type), path in stage.edge_files.items():
+                self.graph_adapter.load_csv_edges(
+                    relation_type, source_type, target_type,
+                    f"file:///{stage_name}/{path.name}"
+                )
+        finally:
+            shutil.rmtree(stage.directory, ignore_errors=True)
+            
+        return result
+        
+    @staticmethod
+    def _repository_node(repo_path: Path, repo_url: str) -> GraphNode:
+        return GraphNode(
+            id=f"repo:{repo_url}",
+            type=EntityType.REPOSITORY,
+            properties={
+                "url": repo_url,
+                "path": str(repo_path),
+                "name": repo_path.name
+            }
+        )
+        
     def _ingest_commits(self, repo_path: Path, repo_id: str) -> int:
         """Ingest commits from cache into both databases"""
-        commit_cache = repo_path / "data" / ".rag_commits"
-        if not commit_cache.exists():
-            return 0
+        count = 0
+        # Commits are read (and, for the JSON cache, parsed in a thread pool)
+        # as they stream in; graph/vector writes stay on this thread
+        for commit_data in find_commit_cache(repo_path / "data" / ".rag_commits").iter_commits():
+            self._ingest_one_commit(commit_data, repo_id)
+            self._maybe_flush()
+            count += 1
+            
+        return count
+        
+    async def _ingest_commits_async(
+        self,
+        repo_path: Path,
+        repo_id: str,
+        concurrency: int = COMMIT_CONCURRENCY
+    ) -> int:
+        """
+        Ingest commits with up to `concurrency` cache files loading at once.
+        Full graph and chunk buffers are flushed in worker threads, so
+        embedding and writes overlap with loading of the following commits.
+        """
+        commit_cache = find_commit_cache(repo_path / "data" / ".rag_commits")
+        if not isinstance(commit_cache, JsonDirBackend):
+            # A SQLite cache is one sequential cursor; nothing to overlap
+            return await asyncio.to_thread(self._ingest_commits, repo_path, repo_id)
             
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def load(commit_file: Path) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(load_commit_file, commit_file)
+                
         count = 0
-        for commit_file in commit_cache.glob("*.json"):
-            with open(commit_file, "r") as f:
-                commit_data = json.load(f)
+        flushing: Optional[asyncio.Task] = None
+        storing: Optional[asyncio.Task] = None
+        for next_commit in asyncio.as_completed(
+            [load(commit_file) for commit_file in commit_cache.paths()]
+        ):
+            commit_data = await next_commit
+            self._ingest_one_commit(commit_data, repo_id)
+            count += 1
+            
+            if self._buffered >= GRAPH_BATCH_SIZE:
+                # Batches are not self-contained: developer and file nodes
+                # are emitted once per run, so this batch's edges can point
+                # at nodes from an earlier batch. Waiting for the previous
+                # flush keeps those nodes written first; don't drop it
+                if flushing is not None:
+                    await flushing
+                flushing = asyncio.create_task(
+                    asyncio.to_thread(self._write_buffers, *self._take_buffers())
+                )
                 
-            # Create commit node in graph
-            commit_node = GraphNode(
-                id=f"commit:{commit_data['sha']}",
-                type=EntityType.COMMIT,
-                properties={
-                    "sha": commit_data["sha"],
-                    "message": commit_data["message"],
-                    "author": commit_data["author"],
-                    "timestamp": commit_data["timestamp"]
-                }
-            )
-            node_id = self.graph_adapter.create_node(commit_node)
+            if len(self._chunk_buffer) >= CHUNK_BATCH_SIZE:
+                # Embedding is CPU-bound; keep it, and the upsert, off the loop
+                if storing is not None:
+                    await storing
+                chunks, self._chunk_buffer = self._chunk_buffer, []
+                storing = asyncio.create_task(
+                    asyncio.to_thread(self.vector_store.add_chunks, chunks)
+                )
+                
+        for task in (flushing, storing):
+            if task is not None:
+                await task
+        return count
+        
+    def _add_node(self, node: GraphNode):
+        self._node_buffer[node.type].append(node)
+        self._buffered += 1
+        
+    def _add_edge(self, edge: GraphEdge):
+        self._edge_buffer[edge.type].append(edge)
+        self._buffered += 1
+        
+    def _maybe_flush(self, batch_size: int = GRAPH_BATCH_SIZE):
+        """Flush buffered graph writes and vector chunks once batches have accumulated"""
+        if self._buffered >= batch_size:
+            self._flush_all()
+        if len(self._chunk_buffer) >= CHUNK_BATCH_SIZE:
+            self._flush_chunks()
+            
+    def _take_buffers(self) -> Tuple[NodeBuffer, EdgeBuffer]:
+        """Detach the pending graph writes, leaving empty buffers behind"""
+        buffers = (self._node_buffer, self._edge_buffer)
+        self._node_buffer = defaultdict(list)
+        self._edge_buffer = defaultdict(list)
+        self._buffered = 0
+        return buffers
+        
+    def _write_buffers(self, node_buffer: NodeBuffer, edge_buffer: EdgeBuffer):
+        if self._csv_stage is not None:
+            for label, rows in node_buffer.items():
+                self._csv_stage.write_nodes(label, rows)
+            for rows in edge_buffer.values():
+                self._csv_stage.write_edges(rows)
+            return
+            
+        # Nodes first so the edge MATCHes can find both endpoints
+        for label, rows in node_buffer.items():
+            self._flush_nodes(label, rows)
+        for rel, rows in edge_buffer.items():
+            self._flush_edges(rel, rows)
             
-            # Create developer node if not exists
-            dev_node = GraphNode(
-                id=f"dev:{commit_data['author']}",
+    def _flush_nodes(self, label: EntityType, rows: List[GraphNode]):
+        """MERGE one label's buffered nodes via UNWIND"""
+        self.graph_adapter.bulk_create_nodes(rows, batch_size=GRAPH_BATCH_SIZE)
+        
+    def _flush_edges(self, rel: RelationType, rows: List[GraphEdge]):
+        """MERGE one relationship type's buffered edges via UNWIND"""
+        self.graph_adapter.bulk_create_edges(rows, batch_size=GRAPH_BATCH_SIZE)
+        
+    def _flush_all(self):
+        """Write every buffered node and edge"""
+        self._write_buffers(*self._take_buffers())
+        
+    def _add_chunk(self, chunk: Any):
+        # Flushed by _maybe_flush, or by the async commit loop in a thread
+        self._chunk_buffer.append(chunk)
+        
+    def _flush_chunks(self):
+        """Embed and write buffered chunks with one vector store call"""
+        if not self._chunk_buffer:
+            return
+        chunks, self._chunk_buffer = self._chunk_buffer, []
+        self.vector_store.add_chunks(chunks)
+        
+    def _ingest_one_commit(
+        self,
+        commit_data: Dict[str, Any],
+        repo_id: str
+    ):
+        """Append one commit's graph writes and queue its vector chunks"""
+        commit_data = _normalize_commit(commit_data)
+        
+        # Create commit node in graph
+        commit_node = GraphNode(
+            id=f"commit:{commit_data['sha']}",
+            type=EntityType.COMMIT,
+            properties={
+                "sha": commit_data["sha"],
+                "message": commit_data["message"],
+                "author": commit_data["author"],
+                "timestamp": commit_data["timestamp"]
+            }
+        )
+        self._add_node(commit_node)
+        
+        # Create developer node if not exists
+        dev_id = f"dev:{commit_data['author']}"
+        if dev_id not in self._seen_devs:
+            self._seen_devs.add(dev_id)
+            self._add_node(GraphNode(
+                id=dev_id,
                 type=EntityType.DEVELOPER,
                 properties={
                     "name": commit_data["author"],
                     "email": commit_data.get("author_email", "")
                 }
-            )
-            self.graph_adapter.create_node(dev_node)
-            
-            # Create AUTHORED_BY relationship
-            self.graph_adapter.create_edge(GraphEdge(
-                source_id=commit_node.id,
-                target_id=dev_node.id,
-                type=RelationType.AUTHORED_BY,
-                properties={}
             ))
-            
-            # Create PART_OF_REPOSITORY relationship
-            self.graph_adapter.create_edge(GraphEdge(
-                source_id=commit_node.id,
-                target_id=repo_id,
-                type=RelationType.PART_OF_REPOSITORY,
-                properties={}
-            ))
-            
-            # Process modified files
-            for file_path in commit_data.get("files_changed", []):
-                file_node = GraphNode(
-                    id=f"file:{repo_id}:{file_path}",
+        
+        # Create AUTHORED_BY relationship
+        self._add_edge(GraphEdge(
+            source_id=commit_node.id,
+            target_id=dev_id,
+            type=RelationType.AUTHORED_BY,
+            properties={},
+            source_type=EntityType.COMMIT,
+            target_type=EntityType.DEVELOPER
+        ))
+        
+        # Create PART_OF_REPOSITORY relationship
+        self._add_edge(GraphEdge(
+            source_id=commit_node.id,
+            target_id=repo_id,
+            type=RelationType.PART_OF_REPOSITORY,
+            properties={},
+            source_type=EntityType.COMMIT,
+            target_type=EntityType.REPOSITORY
+        ))
+        
+        # Process modified files; paths are git's POSIX-style strings, so
+        # ids and names are built with plain string ops
+        file_ids = []
+        repo_file_prefix = f"file:{repo_id}:"
+        for file_path in commit_data.get("files_changed", []):
+            file_id = repo_file_prefix + file_path
+            if file_id not in self._seen_files:
+                self._seen_files.add(file_id)
+                self._add_node(GraphNode(
+                    id=file_id,
                     type=EntityType.FILE,
                     properties={
                         "path": file_path,
-                        "name": Path(file_path).name
+                        "name": file_path.rsplit("/", 1)[-1]
                     }
-                )
-                self.graph_adapter.create_node(file_node)
-                
-                # Create MODIFIES relationship
-                self.graph_adapter.create_edge(GraphEdge(
-                    source_id=commit_node.id,
-                    target_id=file_node.id,
-                    type=RelationType.MODIFIES,
-                    properties={}
                 ))
-                
-            # Add to vector store with graph reference
-            chunks = self.chunker.chunk_commit(commit_data)
-            for chunk in chunks:
-                chunk.metadata["graph_node_id"] = commit_node.id
-                self.vector_store.add_chunk(chunk)
-                
-            count += 1
+            file_ids.append(file_id)
+            self._file_commits.setdefault(file_id, []).append(
+                _neighbor(commit_node.id, sha=commit_data["sha"])
+            )
             
-        return count
-        
+            # Create MODIFIES relationship
+            self._add_edge(GraphEdge(
+                source_id=commit_node.id,
+                target_id=file_id,
+                type=RelationType.MODIFIES,
+                properties={},
+                source_type=EntityType.COMMIT,
+                target_type=EntityType.FILE
+            ))
+            
+        # Add to vector store with graph reference
+        chunks = self.chunker.chunk_commit(commit_data)
+        neighbors = [_neighbor(dev_id, name=commit_data["author"])] + [
+            _neighbor(file_id, name=file_path.rsplit("/", 1)[-1], path=file_path)
+            for file_id, file_path in zip(file_ids, commit_data.get("files_changed", []))
+        ]
+        for chunk in chunks:
+            chunk.metadata["graph_node_id"] = commit_node.id
+            chunk.metadata["graph_node_type"] = commit_node.type.value
+            _set_neighbors(chunk, neighbors)
+            self._add_chunk(chunk)
+
     def _ingest_files(self, repo_path: Path, repo_id: str) -> int:
         """Ingest source files into both databases"""
-        count = 0
         src_path = repo_path / "src"
         
         if not src_path.exists():
             src_path = repo_path  # Fallback to repo root
             
-        for file_path in src_path.rglob("*.py"):
-            # Skip test files for now
-            if "test" in file_path.name.lower():
-                continue
-                
-            # Create file node
-            rel_path = file_path.relative_to(repo_path)
-            file_node = GraphNode(
-                id=f"file:{repo_id}:{rel_path}",
-                type=EntityType.FILE,
-                properties={
-                    "path": str(rel_path),
-                    "name": file_path.name,
-                    "extension": file_path.suffix
-                }
-            )
-            self.graph_adapter.create_node(file_node)
+        file_paths = list(iter_source_files(src_path, _SKIP_RE))
+        batches = [
+            file_paths[i:i + FILE_CHUNK_BATCH_SIZE]
+            for i in range(0, len(file_paths), FILE_CHUNK_BATCH_SIZE)
+        ]
+        
+        if len(batches) <= 1:
+            # Not worth starting worker processes for a single batch
+            results = (_chunk_many(repo_id, repo_path, batch) for batch in batches)
+            return self._consume_file_results(results)
             
-            # Read and chunk file content
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                chunks = self.chunker.chunk_code(content, str(rel_path))
-                
-                for chunk in chunks:
-                    # Add graph reference to metadata
-                    chunk.metadata["graph_node_id"] = file_node.id
+        # This process already runs driver and executor threads (and may be
+        # called from asyncio.to_thread), so workers must not be forked
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver")) as executor:
+            futures = [
+                executor.submit(_chunk_many, repo_id, repo_path, batch)
+                for batch in batches
+            ]
+            return self._consume_file_results(
+                future.result() for future in as_completed(futures)
+            )
+        
+    def _consume_file_results(self, results: Iterable[List[FileChunks]]) -> int:
+        """Buffer graph writes and store chunks for chunked files, on this thread"""
+        count = 0
+        for batch in results:
+            for file_node, entity_nodes, chunks, error in batch:
+                self._add_node(file_node)
+                if error is not None:
+                    logger.error(f"Error processing file {file_node.properties['path']}: {error}")
+                    self._maybe_flush()
+                    continue
                     
-                    # If chunk is a function or class, create separate node
-                    if chunk.chunk_type in ["function", "class"]:
-                        entity_type = (
-                            EntityType.FUNCTION 
-                            if chunk.chunk_type == "function" 
-                            else EntityType.CLASS
-                        )
-                        entity_node = GraphNode(
-                            id=f"{chunk.chunk_type}:{file_node.id}:{chunk.metadata.get('name', 'unknown')}",
-                            type=entity_type,
-                            properties={
-                                "name": chunk.metadata.get("name", "unknown"),
-                                "file_path": str(rel_path),
-                                "start_line": chunk.start_line,
-                                "end_line": chunk.end_line
-                            }
-                        )
-                        self.graph_adapter.create_node(entity_node)
-                        
-                        # Create CONTAINS relationship
-                        self.graph_adapter.create_edge(GraphEdge(
-                            source_id=file_node.id,
-                            target_id=entity_node.id,
-                            type=RelationType.CONTAINS,
-                            properties={}
-                        ))
-                        
-                        # Update chunk metadata with entity node ID
-                        chunk.metadata["graph_node_id"] = entity_node.id
+                for entity_node in entity_nodes:
+                    self._add_node(entity_node)
+                    
+                    # Create CONTAINS relationship
+                    self._add_edge(GraphEdge(
+                        source_id=file_node.id,
+                        target_id=entity_node.id,
+                        type=RelationType.CONTAINS,
+                        properties={},
+                        source_type=EntityType.FILE,
+                        target_type=entity_node.type
+                    ))
+                    
+                file_neighbors = self._file_commits.get(file_node.id, [])
+                for chunk in chunks:
+                    if chunk.metadata["graph_node_id"] == file_node.id:
+                        # Entity neighbours aren't known here, so only file
+                        # chunks carry them; search asks the graph otherwise
+                        _set_neighbors(chunk, file_neighbors)
                         
                     # Add to vector store
-                    self.vector_store.add_chunk(chunk)
+                    self._add_chunk(chunk)
                     
                 count += 1
-                
-            except Exception as e:
-                logger.error(f"Error processing file {file_path}: {e}")
+                self._maybe_flush()
                 
         return count
+
+
+def iter_source_files(root: Path, skip_re: Any, suffix: str = ".py") -> Iterator[Path]:
+    """
+    Walk `root` with os.scandir, yielding `suffix` files whose path relative
+    to `root` doesn't match `skip_re`. Hidden and skipped directories are
+    pruned before descending; directory symlinks are not followed.
+    """
+    pending = deque([("", os.fspath(root))])
+    while pending:
+        rel_dir, directory = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel_path = rel_dir + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and not skip_re.search(rel_path + "/"):
+                            pending.append((rel_path + "/", entry.path))
+                    elif (
+                        entry.name.endswith(suffix)
+                        and entry.is_file()
+                        and not skip_re.search(rel_path)
+                    ):
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+
+
+def _neighbor(
+    node_id: str,
+    name: Optional[str] = None,
+    path: Optional[str] = None,
+    sha: Optional[str] = None
+) -> Dict[str, Any]:
+    """A neighbour as the graph traversal projects it (see neo4j_adapter._rel_query)"""
+    return {"id": node_id, "vector_id": None, "name": name, "path": path, "sha": sha}
+
+
+def _set_neighbors(chunk: Any, neighbors: List[Dict[str, Any]]):
+    chunk.metadata["graph_neighbors"] = json.dumps(neighbors[:GRAPH_NEIGHBORS_LIMIT])
+    chunk.metadata["graph_neighbors_truncated"] = len(neighbors) > GRAPH_NEIGHBORS_LIMIT
+
+
+def _normalize_commit(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a commit cache record onto the fields ingestion reads: sha, message,
+    author, author_email, timestamp and files_changed. Handles records from
+    ingest_commits (hash/subject/body/date) and the memory cards written by
+    enhanced_commit_ingestion; records already in this shape pass through.
+    """
+    if "sha" in raw:
+        return raw
+    if "what_changed" in raw:
+        metadata = raw.get("metadata", {})
+        return {
+            "sha": metadata["special_code"],
+            "message": raw["what_changed"],
+            "author": metadata.get("author", ""),
+            "author_email": metadata.get("author_email", ""),
+            "timestamp": metadata.get("timestamp_iso", metadata.get("date", "")),
+            "files_changed": metadata.get("files_changed", [])
+        }
+    body = raw.get("body", "").strip()
+    return {
+        "sha": raw["hash"],
+        "message": f"{raw['subject']}\n\n{body}" if body else raw["subject"],
+        "author": raw["author"],
+        "author_email": raw.get("email", ""),
+        "timestamp": raw["date"],
+        "files_changed": raw.get("files_changed", [])
+    }
+
+
+_worker_chunker: Optional[CodeAwareChunker] = None
+
+
+def _get_worker_chunker() -> CodeAwareChunker:
+    """One chunker per worker process, built on first use"""
+    global _worker_chunker
+    if _worker_chunker is None:
+        _worker_chunker = CodeAwareChunker(get_rag_config())
+    return _worker_chunker
+
+
+def chunk_file(repo_id: str, repo_path: Path, file_path: Path) -> FileChunks:
+    """
+    Build a source file's graph node, its function/class nodes and its
+    vector chunks. Pure apart from reading the file, so it can run in a
+    worker process; errors are returned rather than raised.
+    """
+    rel_path = str(file_path.relative_to(repo_path))
+    file_node = GraphNode(
+        id=f"file:{repo_id}:{rel_path}",
+        type=EntityType.FILE,
+        properties={
+            "path": rel_path,
+            "name": file_path.name,
+            "extension": file_path.suffix
+        }
+    )
+    
+    try:
+        content = file_path.read_text(encoding="utf-8")
+        chunks = _get_worker_chunker().chunk_file(rel_path, content)
+    except Exception as e:
+        return file_node, [], [], str(e)
+        
+    # Function/class node ids share a per-file prefix for each chunk type;
+    # the chunker records the name under a type-specific metadata key
+    entity_prefixes = {
+        ChunkType.FUNCTION: (f"function:{file_node.id}:", EntityType.FUNCTION, "function_name"),
+        ChunkType.CLASS: (f"class:{file_node.id}:", EntityType.CLASS, "class_name"),
+    }
+    entity_nodes: List[GraphNode] = []
+    for chunk in chunks:
+        # Add graph reference to metadata
+        chunk.metadata["graph_node_id"] = file_node.id
+        chunk.metadata["graph_node_type"] = file_node.type.value
+        
+        # If chunk is a function or class, create separate node
+        entity = entity_prefixes.get(chunk.chunk_type)
+        if entity is not None:
+            prefix, entity_type, name_key = entity
+            name = chunk.metadata.get(name_key, "unknown")
+            entity_node = GraphNode(
+                id=prefix + name,
+                type=entity_type,
+                properties={
+                    "name": name,
+                    "file_path": rel_path,
+                    "start_line": chunk.start_line,
+                    "end_line": chunk.end_line
+                }
+            )
+            entity_nodes.append(entity_node)
+            
+            # Update chunk metadata with entity node ID
+            chunk.metadata["graph_node_id"] = entity_node.id
+            chunk.metadata["graph_node_type"] = entity_type.value
+            
+    return file_node, entity_nodes, chunks, None
+
+
+def _chunk_many(repo_id: str, repo_path: Path, file_paths: List[Path]) -> List[FileChunks]:
+    return [chunk_file(repo_id, repo_path, file_path) for file_path in file_paths]
@@ -4,57 +4,89 @@ Generic Git commit ingestion script for RAG/AI backend.
 Extracts commit history from any git repository and outputs JSON memory cards to .rag_commits/.
 """
 
-import os
-import json
+import logging
 import subprocess
 from pathlib import Path
-from ..config import settings
+from typing import Dict, Iterable, Iterator
 
+from ..config import get_settings
+from .commit_cache import open_commit_cache
 
-def get_commits(repo_path: Path):
-    os.chdir(repo_path)
-    log_format = "%H%x1f%an%x1f%ae%x1f%ad%x1f%s%x1f%b%x1e"
-    result = subprocess.run(
-        ["git", "log", f"--pretty=format:{log_format}", "--date=iso"],
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = "%H%x1f%an%x1f%ae%x1f%ad%x1f%s%x1f%b%x1e"
+READ_SIZE = 65536
+
+
+def _parse_commit(raw: str):
+    # Split before trimming: str.strip() treats \x1f as whitespace, so it
+    # would eat the separator in front of an empty body
+    parts = raw.split("\x1f")
+    if len(parts) < 6:
+        return None
+    parts[0] = parts[0].lstrip()
+    parts[5] = parts[5].rstrip()
+    return {
+        "hash": parts[0],
+        "author": parts[1],
+        "email": parts[2],
+        "date": parts[3],
+        "subject": parts[4],
+        "body": parts[5],
+    }
+
+
+def get_commits(repo_path: Path) -> Iterator[Dict[str, str]]:
+    """Yield commits as `git log` streams them, without buffering the history"""
+    proc = subprocess.Popen(
+        ["git", "log", f"--pretty=format:{LOG_FORMAT}", "--date=iso"],
+        cwd=repo_path,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
+        bufsize=1 << 20,
     )
-    if result.returncode != 0:
-        raise RuntimeError(f"Git log failed: {result.stderr}")
-    raw_commits = result.stdout.strip().split("\x1e")
-    commits = []
-    for raw in raw_commits:
-        if not raw.strip():
-            continue
-        parts = raw.strip().split("\x1f")
-        if len(parts) < 6:
-            continue
-        commit = {
-            "hash": parts[0],
-            "author": parts[1],
-            "email": parts[2],
-            "date": parts[3],
-            "subject": parts[4],
-            "body": parts[5],
-        }
-        commits.append(commit)
-    return commits
-
-
-def save_commits(commits, output_dir: Path):
-    output_dir.mkdir(parents=True, exist_ok=True)
-    for commit in commits:
-        out_path = output_dir / f"commit_{commit['hash']}.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(commit, f, indent=2)
-
-
-def main():
+    try:
+        buffer = ""
+        for chunk in iter(lambda: proc.stdout.read(READ_SIZE), ""):
+            buffer += chunk
+            *records, buffer = buffer.split("\x1e")
+            for raw in records:
+                commit = _parse_commit(raw)
+                if commit is not None:
+                    yield commit
+        commit = _parse_commit(buffer)
+        if commit is not None:
+            yield commit
+
+        stderr = proc.stderr.read()
+        if proc.wait() != 0:
+            raise RuntimeError(f"Git log failed: {stderr}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def save_commits(
+    commits: Iterable[Dict[str, str]],
+    output_dir: Path,
+    backend: str = "json"
+) -> int:
+    """Write commits to the cache in `output_dir`, returning how many were written"""
+    return open_commit_cache(output_dir, backend).write_many(commits)
+
+
+def main() -> int:
+    settings = get_settings()
     repo_path = (
         settings.project_root
     )  # Assuming the current working directory is the repo root
     output_dir = settings.commit_cache_dir
-    commits = get_commits(repo_path)
-    save_commits(commits, output_dir)
-    print(f"Ingested {len(commits)} commits from {repo_path} to {output_dir}")
+    count = save_commits(
+        get_commits(repo_path), output_dir, settings.commit_cache_backend
+    )
+    logger.info(f"Ingested {count} commits from {repo_path} to {output_dir}")
+    return count
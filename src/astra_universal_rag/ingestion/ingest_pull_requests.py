@@ -5,10 +5,11 @@ Extend this script to support GitHub, GitLab, or other providers.
 Outputs JSON memory cards to .rag_pull_requests/.
 """
 
-from ..config import settings
+from ..config import get_settings
 
 
 def main():
+    settings = get_settings()
     output_dir = (
         settings.commit_cache_dir
     )  # Using commit_cache_dir as a placeholder for PRs for now
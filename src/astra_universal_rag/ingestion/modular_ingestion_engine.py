@@ -6,15 +6,53 @@ Microservice-based ingestion with orchestrator and workers
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from datetime import datetime
-import aioredis
+import time
+import uuid
+import weakref
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import asdict, dataclass
+import orjson
+from redis.asyncio import BlockingConnectionPool, Redis
 from ..connectors.base_connector import BaseConnector, DataEntity
 from ..hybrid.hybrid_rag import HybridRAG
 
 logger = logging.getLogger(__name__)
 
+# Job records expire from Redis after 24 hours
+JOB_TTL_SECONDS = 86400
+# Minimum seconds between progress writes for a running job
+PROGRESS_UPDATE_INTERVAL = 2.0
+
+# Redis list of job ids waiting for a worker; each worker moves the id it
+# is processing onto its own list so a crashed job can be requeued
+JOB_LIST_KEY = "ingestion_jobs:pending"
+REDIS_MAX_CONNECTIONS = 32
+# Buffered status writes are sent in one pipeline per PIPELINE_MAX_OPS
+# commands or PIPELINE_MAX_DELAY seconds, whichever comes first
+PIPELINE_MAX_OPS = 50
+PIPELINE_MAX_DELAY = 0.1
+# Buffered job updates are applied only while the job hash still exists: a
+# plain HSET landing after expiry would recreate it without its other
+# fields or a TTL. The TTL is refreshed in the same step.
+# KEYS[1] = job key, ARGV = ttl, field, value, field, value, ...
+_UPDATE_JOB_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+# Entities handed to _process_entities at once, and how long to wait for
+# a partial batch to fill before processing it anyway
+ENTITY_BATCH_SIZE = 100
+ENTITY_BATCH_WAIT = 0.05
+_END_OF_ENTITIES = object()
+
+# Orchestrators between initialize() and shutdown(), for process shutdown
+_ORCHESTRATORS: "weakref.WeakSet[IngestionOrchestrator]" = weakref.WeakSet()
+
 
 @dataclass
 class IngestionJob:
@@ -24,12 +62,63 @@ class IngestionJob:
     entity_type: str
     filters: Dict[str, Any]
     status: str  # pending, processing, completed, failed
-    created_at: datetime
-    completed_at: Optional[datetime] = None
+    created_at: float  # epoch seconds
+    completed_at: Optional[float] = None
     error: Optional[str] = None
     entities_processed: int = 0
 
 
+def _job_key(job_id: str) -> str:
+    return f"ingestion_job:{job_id}"
+
+
+def _serialize(job: IngestionJob, *fields: str) -> Dict[str, bytes]:
+    """
+    Encode job fields as orjson values of a Redis hash. All fields are
+    encoded unless specific (dirty) ones are named.
+    """
+    data = asdict(job) if not fields else {name: getattr(job, name) for name in fields}
+    return {name: orjson.dumps(value) for name, value in data.items()}
+
+
+def _deserialize(raw: Dict[Any, bytes]) -> IngestionJob:
+    data = {
+        name.decode() if isinstance(name, bytes) else name: orjson.loads(value)
+        for name, value in raw.items()
+    }
+    return IngestionJob(**data)
+
+
+async def _drain(queue: asyncio.Queue, max_items: int, max_wait: float) -> List[Any]:
+    """
+    Block for one item, then take up to `max_items` in total, waiting at
+    most `max_wait` seconds overall for more to arrive.
+    """
+    loop = asyncio.get_running_loop()
+    items = [await queue.get()]
+    deadline = loop.time() + max_wait
+    while len(items) < max_items:
+        try:
+            items.append(queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            items.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    return items
+
+
+async def shutdown_orchestrators():
+    """Shut down every initialized orchestrator, e.g. from an app shutdown hook"""
+    for orchestrator in list(_ORCHESTRATORS):
+        await orchestrator.shutdown()
+
+
 class IngestionOrchestrator:
     """Orchestrates ingestion across multiple connectors"""
     
@@ -37,11 +126,20 @@ class IngestionOrchestrator:
         self.redis_url = redis_url
         self.connectors: Dict[str, BaseConnector] = {}
         self.workers: List[IngestionWorker] = []
-        self.job_queue = asyncio.Queue()
+        self._pipeline_buffer: List[Tuple[str, Dict[str, bytes]]] = []
+        self._pipeline_flusher: Optional[asyncio.Task] = None
+        # Serializes flushes so updates to a job reach Redis in order
+        self._pipeline_lock = asyncio.Lock()
         
     async def initialize(self):
         """Initialize orchestrator"""
-        self.redis = await aioredis.create_redis_pool(self.redis_url)
+        self.redis = Redis(
+            connection_pool=BlockingConnectionPool.from_url(
+                self.redis_url, max_connections=REDIS_MAX_CONNECTIONS
+            )
+        )
+        self._pipeline_flusher = asyncio.create_task(self._flush_pipeline_periodically())
+        _ORCHESTRATORS.add(self)
         logger.info("Ingestion orchestrator initialized")
         
     def register_connector(self, name: str, connector: BaseConnector):
@@ -49,6 +147,56 @@ class IngestionOrchestrator:
         self.connectors[name] = connector
         logger.info(f"Registered connector: {name}")
         
+    async def shutdown(self):
+        """Release connector HTTP sessions and the Redis client"""
+        _ORCHESTRATORS.discard(self)
+        for connector in self.connectors.values():
+            await connector.close()
+        if self._pipeline_flusher is not None:
+            self._pipeline_flusher.cancel()
+            self._pipeline_flusher = None
+        await self.flush_pipeline()
+        await self.redis.aclose()
+        logger.info("Ingestion orchestrator shut down")
+        
+    async def update_job_fields(
+        self,
+        job_id: str,
+        fields: Dict[str, bytes],
+        flush: bool = False
+    ):
+        """
+        Buffer a job hash update for the next pipelined flush. Pass `flush`
+        for updates readers must see at once, such as terminal statuses.
+        """
+        self._pipeline_buffer.append((_job_key(job_id), fields))
+        if flush or len(self._pipeline_buffer) >= PIPELINE_MAX_OPS:
+            await self.flush_pipeline()
+            
+    async def flush_pipeline(self):
+        """Send all buffered job updates in one round trip"""
+        # The periodic flusher and a full buffer can both trigger a flush;
+        # without the lock a later batch could overtake an earlier one
+        async with self._pipeline_lock:
+            if not self._pipeline_buffer:
+                return
+            updates, self._pipeline_buffer = self._pipeline_buffer, []
+            pipe = self.redis.pipeline(transaction=False)
+            for key, fields in updates:
+                args = [JOB_TTL_SECONDS]
+                for name, value in fields.items():
+                    args += [name, value]
+                pipe.eval(_UPDATE_JOB_SCRIPT, 1, key, *args)
+            await pipe.execute()
+        
+    async def _flush_pipeline_periodically(self):
+        while True:
+            await asyncio.sleep(PIPELINE_MAX_DELAY)
+            try:
+                await self.flush_pipeline()
+            except Exception as e:
+                logger.error(f"Failed to flush job status updates: {e}")
+        
     async def schedule_ingestion(
         self,
         connector_name: str,
@@ -57,31 +205,30 @@ class IngestionOrchestrator:
     ) -> str:
         """Schedule an ingestion job"""
         job = IngestionJob(
-            id=f"job_{datetime.now().timestamp()}",
+            id=f"job_{uuid.uuid4().hex}",
             connector=connector_name,
             entity_type=entity_type,
             filters=filters or {},
             status="pending",
-            created_at=datetime.now()
+            created_at=time.time()
         )
         
-        # Add to queue
-        await self.job_queue.put(job)
-        
-        # Store in Redis
-        await self.redis.set(
-            f"ingestion_job:{job.id}",
-            job.__dict__,
-            expire=86400  # 24 hours
-        )
+        # Store the job and enqueue its id in one round trip; the hash is
+        # written first so a worker never pops an id it can't load
+        key = _job_key(job.id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(key, mapping=_serialize(job))
+        pipe.expire(key, JOB_TTL_SECONDS)
+        pipe.lpush(JOB_LIST_KEY, job.id)
+        await pipe.execute()
         
         return job.id
         
     async def get_job_status(self, job_id: str) -> Optional[IngestionJob]:
         """Get status of an ingestion job"""
-        data = await self.redis.get(f"ingestion_job:{job_id}")
+        data = await self.redis.hgetall(_job_key(job_id))
         if data:
-            return IngestionJob(**data)
+            return _deserialize(data)
         return None
         
     async def start_workers(self, num_workers: int = 4):
@@ -104,18 +251,29 @@ class IngestionWorker:
         self.worker_id = worker_id
         self.orchestrator = orchestrator
         self.rag_system: Optional[HybridRAG] = None
+        self.processing_key = f"ingestion_jobs:processing:{worker_id}"
         
     async def run(self):
         """Main worker loop"""
         logger.info(f"{self.worker_id} started")
+        redis = self.orchestrator.redis
         
+        # Requeue jobs this worker held when it last stopped
+        while await redis.rpoplpush(self.processing_key, JOB_LIST_KEY):
+            pass
+            
         while True:
             try:
-                # Get job from queue
-                job = await self.orchestrator.job_queue.get()
+                # Claim a job id, keeping it on our processing list until done
+                job_id = (
+                    await redis.brpoplpush(JOB_LIST_KEY, self.processing_key, timeout=0)
+                ).decode()
                 
                 # Process job
-                await self.process_job(job)
+                job = await self.orchestrator.get_job_status(job_id)
+                if job is not None:
+                    await self.process_job(job)
+                await redis.lrem(self.processing_key, 1, job_id)
                 
             except Exception as e:
                 logger.error(f"{self.worker_id} error: {e}")
@@ -128,32 +286,65 @@ class IngestionWorker:
         try:
             # Update job status
             job.status = "processing"
-            await self._update_job_status(job)
+            await self._update_job_status(job, "status")
             
             # Get connector
             connector = self.orchestrator.connectors.get(job.connector)
             if not connector:
                 raise ValueError(f"Unknown connector: {job.connector}")
                 
-            # Fetch and process entities
-            count = 0
-            async for entity in connector.fetch_entities(
-                entity_type=job.entity_type,
-                filters=job.filters
-            ):
-                await self._process_entity(entity)
-                count += 1
+            # Fetch entities in the background and process them in batches
+            entities: asyncio.Queue = asyncio.Queue(maxsize=ENTITY_BATCH_SIZE * 4)
+            
+            async def fetch():
+                try:
+                    async for entity in connector.fetch_entities(
+                        entity_type=job.entity_type,
+                        filters=job.filters
+                    ):
+                        await entities.put(entity)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    await entities.put(_END_OF_ENTITIES)
+                    raise
+                await entities.put(_END_OF_ENTITIES)
+                
+            fetcher = asyncio.create_task(fetch())
+            try:
+                count = 0
+                last_update = time.monotonic()
+                finished = False
+                while not finished:
+                    batch = await _drain(entities, ENTITY_BATCH_SIZE, ENTITY_BATCH_WAIT)
+                    # The end marker is always the last item queued
+                    finished = batch[-1] is _END_OF_ENTITIES
+                    if finished:
+                        batch.pop()
+                    if batch:
+                        await self._process_entities(batch)
+                        count += len(batch)
+                        
+                    # Update progress at most every PROGRESS_UPDATE_INTERVAL
+                    # seconds, however fast or slow the connector is
+                    now = time.monotonic()
+                    if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                        job.entities_processed = count
+                        await self._update_job_status(job, "entities_processed")
+                        last_update = now
+                        
+                # Surface any fetch error
+                await fetcher
+            finally:
+                fetcher.cancel()
                 
-                # Update progress periodically
-                if count % 100 == 0:
-                    job.entities_processed = count
-                    await self._update_job_status(job)
-                    
             # Mark job as completed
             job.status = "completed"
             job.entities_processed = count
-            job.completed_at = datetime.now()
-            await self._update_job_status(job)
+            job.completed_at = time.time()
+            await self._update_job_status(
+                job, "status", "entities_processed", "completed_at", flush=True
+            )
             
             logger.info(
                 f"{self.worker_id} completed job {job.id}: "
@@ -163,19 +354,18 @@ class IngestionWorker:
         except Exception as e:
             job.status = "failed"
             job.error = str(e)
-            await self._update_job_status(job)
+            await self._update_job_status(job, "status", "error", flush=True)
             logger.error(f"{self.worker_id} job {job.id} failed: {e}")
             
-    async def _process_entity(self, entity: DataEntity):
-        """Process a single entity into the RAG system"""
+    async def _process_entities(self, entities: List[DataEntity]):
+        """Process a batch of entities into the RAG system"""
         # This would integrate with the dual pipeline ingestion
-        # Converting external entities to graph nodes and vector chunks
+        # Converting external entities to graph nodes and vector chunks,
+        # written through its batched graph and vector store paths
         pass
         
-    async def _update_job_status(self, job: IngestionJob):
-        """Update job status in Redis"""
-        await self.orchestrator.redis.set(
-            f"ingestion_job:{job.id}",
-            job.__dict__,
-            expire=86400
+    async def _update_job_status(self, job: IngestionJob, *fields: str, flush: bool = False):
+        """Update the changed job fields in Redis"""
+        await self.orchestrator.update_job_fields(
+            job.id, _serialize(job, *fields), flush=flush
         )
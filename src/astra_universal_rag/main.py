@@ -31,6 +31,9 @@ from .models import QueryRequest, QueryResponse, IndexRequest, StatsResponse
 from .rag_system import AstraRAG
 from .security import get_api_key
 from .optimization_manager import RAGOptimizationManager
+from .graph.neo4j_adapter import close_all_drivers
+from .graph.async_neo4j_adapter import close_all_async_drivers
+from .ingestion.modular_ingestion_engine import shutdown_orchestrators
 
 # Phase 3: Proactive Context System
 try:
@@ -138,6 +141,18 @@ async def startup_event():
     print("✅ Claude Code enhancements initialized")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared connection pools on shutdown"""
+    # Closes connector HTTP sessions and the Redis client of any ingestion
+    # orchestrator, flushing its buffered job updates first
+    await shutdown_orchestrators()
+    # Adapters only drop their handles on close(); the pooled drivers are
+    # shared process-wide and closed here
+    close_all_drivers()
+    await close_all_async_drivers()
+
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """Root endpoint"""
@@ -4,13 +4,18 @@ Universal Knowledge Graph Schema - Phase 1
 Defines the core entities and relationships for the hybrid graph-vector architecture
 """
 
+import sys
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+# Nodes and edges are created by the million during ingestion; slots drop
+# the per-instance __dict__ where the interpreter supports them (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class EntityType(Enum):
+
+class EntityType(str, Enum):
     """Core entity types in the knowledge graph"""
     REPOSITORY = "Repository"
     BRANCH = "Branch"
@@ -29,9 +34,12 @@ class EntityType(Enum):
     SLACK_MESSAGE = "SlackMessage"
     SLACK_THREAD = "SlackThread"
     SLACK_CHANNEL = "SlackChannel"
+    
+    # Members format as their value, so they drop straight into Cypher
+    __str__ = str.__str__
 
 
-class RelationType(Enum):
+class RelationType(str, Enum):
     """Core relationship types in the knowledge graph"""
     # Code relationships
     MODIFIES = "MODIFIES"
@@ -59,9 +67,11 @@ class RelationType(Enum):
     DISCUSSED_IN = "DISCUSSED_IN"
     MENTIONED_IN = "MENTIONED_IN"
     RELATES_TO = "RELATES_TO"
+    
+    __str__ = str.__str__
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GraphNode:
     """Base class for all nodes in the knowledge graph"""
     id: str
@@ -70,7 +80,7 @@ class GraphNode:
     vector_id: Optional[str] = None  # Link to ChromaDB vector
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GraphEdge:
     """Base class for all edges in the knowledge graph"""
     source_id: str
@@ -78,3 +88,6 @@ class GraphEdge:
     type: RelationType
     properties: Dict[str, Any]
     weight: float = 1.0
+    # Endpoint labels let Cypher use the per-label id index instead of a scan
+    source_type: Optional[EntityType] = None
+    target_type: Optional[EntityType] = None
@@ -5,7 +5,7 @@ Security module for Astra RAG system
 
 from fastapi import HTTPException, Security
 from fastapi.security import APIKeyHeader
-from .config import settings
+from .config import get_settings
 
 # API Key header configuration
 api_key_header = APIKeyHeader(name="X-API-KEY", auto_error=False)
@@ -24,6 +24,7 @@ async def get_api_key(api_key: str = Security(api_key_header)) -> str:
     Raises:
         HTTPException: If API key is missing or invalid
     """
+    settings = get_settings()
     print(f"[DEBUG] Received API key: '{api_key}' | Expected: '{settings.api_key}'")
     if not api_key:
         raise HTTPException(
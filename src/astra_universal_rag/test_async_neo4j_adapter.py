@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Async Neo4j Adapter Tests
+Sharing of async drivers per event loop and traversal query text; no
+server is contacted
+"""
+
+import asyncio
+import gc
+import weakref
+
+from .graph import async_neo4j_adapter
+from .graph.async_neo4j_adapter import AsyncNeo4jAdapter, close_all_async_drivers
+from .graph.neo4j_adapter import Neo4jAdapter
+from .schemas.universal_schema import EntityType, RelationType
+
+URI = "bolt://localhost:7687"
+
+
+def adapter(username: str = "neo4j") -> AsyncNeo4jAdapter:
+    return AsyncNeo4jAdapter(URI, username, "password")
+
+
+def test_adapters_on_one_loop_share_a_driver():
+    async def run():
+        first, second, other_user = adapter().driver, adapter().driver, adapter("reader").driver
+        await close_all_async_drivers()
+        return first, second, other_user
+
+    first, second, other_user = asyncio.run(run())
+    assert first is second
+    assert other_user is not first
+
+
+def test_each_loop_gets_its_own_driver():
+    shared = adapter()
+
+    async def driver():
+        return shared.driver
+
+    assert asyncio.run(driver()) is not asyncio.run(driver())
+
+
+def test_finished_loops_are_not_kept_alive():
+    loops = []
+
+    async def run():
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        adapter().driver
+
+    asyncio.run(run())
+    # The next lookup drops drivers left behind by closed loops
+    asyncio.run(run())
+    gc.collect()
+    assert loops[0]() is None
+
+
+def test_close_all_closes_the_running_loops_drivers():
+    async def run():
+        adapter().driver
+        await close_all_async_drivers()
+        return asyncio.get_running_loop() in async_neo4j_adapter._ASYNC_DRIVERS
+
+    assert asyncio.run(run()) is False
+
+
+def test_traversal_matches_start_nodes_by_label_when_known():
+    query = Neo4jAdapter._related_nodes_batch_query([RelationType.MODIFIES], 2, EntityType.COMMIT)
+    assert "(start:Commit {id: node_id})" in query
+    assert "(start {id: node_id})" in Neo4jAdapter._related_nodes_batch_query([RelationType.MODIFIES], 2)
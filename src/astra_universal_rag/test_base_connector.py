@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Base Connector Tests
+Token bucket rate limiting shared by all connectors
+"""
+
+import asyncio
+
+import pytest
+
+from .connectors import base_connector
+from .connectors.base_connector import AsyncTokenBucket
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Stands in for the time module; sleeping advances it instead of waiting"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+        # Still yield, so concurrent waiters interleave as they would
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(base_connector, "time", fake)
+    monkeypatch.setattr(base_connector.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def test_bursts_up_to_the_rate_without_waiting(clock):
+    async def run():
+        bucket = AsyncTokenBucket(5, period=1.0)
+        for _ in range(5):
+            async with bucket:
+                pass
+
+    asyncio.run(run())
+    assert clock.sleeps == []
+
+
+def test_waits_for_a_token_once_the_burst_is_spent(clock):
+    async def run():
+        # One token every 0.2 seconds
+        bucket = AsyncTokenBucket(5, period=1.0)
+        for _ in range(5):
+            await bucket.acquire()
+        started = clock.now
+        await bucket.acquire()
+        return clock.now - started
+
+    assert asyncio.run(run()) == pytest.approx(0.2)
+
+
+def test_concurrent_waiters_are_paced(clock):
+    async def run():
+        bucket = AsyncTokenBucket(10, period=0.5)
+        started = clock.now
+        await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+        return clock.now - started
+
+    # 10 from the burst, then 5 more at one per 0.05 seconds
+    assert asyncio.run(run()) == pytest.approx(0.25)
+    assert len(clock.sleeps) == 5
+
+
+def test_idle_time_refills_only_up_to_capacity(clock):
+    async def run():
+        bucket = AsyncTokenBucket(3, period=1.0)
+        for _ in range(3):
+            await bucket.acquire()
+        clock.now += 100
+        bucket._refill()
+        return bucket._tokens
+
+    assert asyncio.run(run()) == 3
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Commit Cache Tests
+Round trips through the JSON and SQLite backends and backend selection
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from .ingestion.commit_cache import (
+    SQLITE_FILENAME,
+    JsonDirBackend,
+    SqliteBackend,
+    find_commit_cache,
+    open_commit_cache,
+)
+
+COMMITS = [
+    {"hash": f"{i:040x}", "author": "Ada", "subject": f"Change {i}"}
+    for i in range(5)
+]
+
+
+def by_hash(commits):
+    return sorted(commits, key=lambda commit: commit["hash"])
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_round_trip(tmp_path, backend):
+    cache = open_commit_cache(tmp_path, backend)
+    # A generator, as get_commits streams them
+    assert cache.write_many(commit for commit in COMMITS) == len(COMMITS)
+    assert by_hash(cache.iter_commits()) == COMMITS
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_rewriting_a_commit_replaces_it(tmp_path, backend):
+    cache = open_commit_cache(tmp_path, backend)
+    cache.write_many(COMMITS)
+    cache.write_many([{**COMMITS[0], "subject": "Reworded"}])
+
+    commits = by_hash(cache.iter_commits())
+    assert len(commits) == len(COMMITS)
+    assert commits[0]["subject"] == "Reworded"
+
+
+def test_json_backend_writes_one_file_per_commit(tmp_path):
+    open_commit_cache(tmp_path, "json").write_many(COMMITS)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        f"commit_{commit['hash']}.json" for commit in COMMITS
+    ]
+
+
+def test_empty_caches_yield_nothing(tmp_path):
+    assert list(JsonDirBackend(tmp_path / "missing").iter_commits()) == []
+    assert list(SqliteBackend(tmp_path / SQLITE_FILENAME).iter_commits()) == []
+
+
+def test_writes_honour_the_requested_backend(tmp_path):
+    open_commit_cache(tmp_path, "sqlite").write_many(COMMITS[:1])
+    # An existing SQLite file doesn't redirect a JSON write
+    cache = open_commit_cache(tmp_path, "json")
+    assert isinstance(cache, JsonDirBackend)
+    cache.write_many(COMMITS[1:])
+    assert len(list(tmp_path.glob("commit_*.json"))) == len(COMMITS) - 1
+
+
+def test_reads_use_the_only_cache_present(tmp_path):
+    assert isinstance(find_commit_cache(tmp_path), JsonDirBackend)
+    open_commit_cache(tmp_path, "sqlite").write_many(COMMITS)
+    cache = find_commit_cache(tmp_path)
+    assert isinstance(cache, SqliteBackend)
+    assert by_hash(cache.iter_commits()) == COMMITS
+
+
+def set_mtime(path: Path, seconds: int):
+    os.utime(path, ns=(seconds * 10**9, seconds * 10**9))
+
+
+def test_reads_prefer_the_most_recently_written_cache(tmp_path, caplog):
+    open_commit_cache(tmp_path, "sqlite").write_many(COMMITS[:1])
+    open_commit_cache(tmp_path, "json").write_many(COMMITS)
+    set_mtime(tmp_path / SQLITE_FILENAME, 1000)
+    for path in tmp_path.glob("commit_*.json"):
+        set_mtime(path, 2000)
+    # A stale SQLite file left from an earlier backend setting doesn't win
+    assert isinstance(find_commit_cache(tmp_path), JsonDirBackend)
+    assert "Both JSON and SQLite commit caches" in caplog.text
+
+    set_mtime(tmp_path / SQLITE_FILENAME, 3000)
+    assert isinstance(find_commit_cache(tmp_path), SqliteBackend)
+
+
+def test_unknown_backend_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        open_commit_cache(tmp_path, "parquet")
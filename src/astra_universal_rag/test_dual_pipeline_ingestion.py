@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Dual Pipeline Ingestion Smoke Test
+Runs repository ingestion end to end against in-memory graph and vector stores
+"""
+
+import asyncio
+import csv
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from .ingestion.dual_pipeline_ingestion import (
+    _SKIP_RE,
+    GRAPH_NEIGHBORS_LIMIT,
+    DualPipelineIngestion,
+    iter_source_files,
+)
+from .ingestion.ingest_commits import save_commits
+from .schemas.universal_schema import EntityType, GraphEdge, GraphNode, RelationType
+
+REPO_URL = "https://github.com/astra/example"
+REPO_ID = f"repo:{REPO_URL}"
+
+COMMITS = [
+    {
+        "hash": "a" * 40,
+        "author": "Ada",
+        "email": "ada@example.com",
+        "date": "2025-01-01 10:00:00 +0000",
+        "subject": "Add payment module",
+        "body": "Handles card payments.",
+        "files_changed": ["src/payments.py"],
+    },
+    {
+        "hash": "b" * 40,
+        "author": "Ada",
+        "email": "ada@example.com",
+        "date": "2025-01-02 10:00:00 +0000",
+        "subject": "Fix rounding",
+        "body": "",
+    },
+]
+
+PAYMENTS_SOURCE = '''"""Payment processing."""
+import decimal
+
+
+class PaymentProcessor:
+    """Charges cards."""
+
+    def charge(self, amount):
+        return decimal.Decimal(amount)
+
+
+def refund(amount):
+    return -amount
+'''
+
+
+class FakeGraphAdapter:
+    """Records graph writes instead of sending them to Neo4j"""
+
+    def __init__(self, import_dir: Optional[Path] = None):
+        self.nodes: Dict[str, Any] = {}
+        self.edges: List[Any] = []
+        # LOAD CSV resolves file:/// URLs against the server's import directory
+        self.import_dir = import_dir
+
+    def create_node(self, node):
+        self.nodes[node.id] = node
+
+    def bulk_create_nodes(self, nodes, batch_size=None):
+        for node in nodes:
+            self.nodes[node.id] = node
+
+    def bulk_create_edges(self, edges, batch_size=None):
+        self.edges.extend(edges)
+
+    def _read_csv(self, url: str) -> List[Dict[str, str]]:
+        assert url.startswith("file:///")
+        with open(self.import_dir / url[len("file:///"):], newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def load_csv_nodes(self, entity_type, url):
+        for row in self._read_csv(url):
+            self.nodes[row["id"]] = GraphNode(
+                id=row["id"],
+                type=entity_type,
+                properties=json.loads(row["properties"]),
+                vector_id=row["vector_id"] or None,
+            )
+
+    def load_csv_edges(self, relation_type, source_type, target_type, url):
+        self.edges.extend(
+            GraphEdge(
+                source_id=row["source_id"],
+                target_id=row["target_id"],
+                type=relation_type,
+                properties=json.loads(row["properties"]),
+                weight=float(row["weight"]),
+                source_type=source_type,
+                target_type=target_type,
+            )
+            for row in self._read_csv(url)
+        )
+
+
+class FakeVectorStore:
+    """Collects chunks instead of embedding them"""
+
+    def __init__(self):
+        self.chunks: List[Any] = []
+
+        self.threads: List[int] = []
+
+    def add_chunks(self, chunks):
+        self.threads.append(threading.get_ident())
+        self.chunks.extend(chunks)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setenv("API_KEY", "test")
+    save_commits(COMMITS, tmp_path / "data" / ".rag_commits")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "payments.py").write_text(PAYMENTS_SOURCE)
+    (tmp_path / "src" / "test_payments.py").write_text("def test_refund():\n    pass\n")
+    return tmp_path
+
+
+def _check_ingestion(result, graph: FakeGraphAdapter, vectors: FakeVectorStore):
+    assert result == {
+        "repository": REPO_URL,
+        "commits_ingested": 2,
+        "files_ingested": 1,
+    }
+
+    file_id = f"file:{REPO_ID}:src/payments.py"
+    commit = graph.nodes[f"commit:{'a' * 40}"]
+    assert commit.type == EntityType.COMMIT
+    assert commit.properties["message"] == "Add payment module\n\nHandles card payments."
+    assert graph.nodes["dev:Ada"].properties["email"] == "ada@example.com"
+    assert graph.nodes[file_id].type == EntityType.FILE
+    assert f"file:{REPO_ID}:src/test_payments.py" not in graph.nodes
+
+    class_id = f"class:{file_id}:PaymentProcessor"
+    function_id = f"function:{file_id}:refund"
+    assert graph.nodes[class_id].type == EntityType.CLASS
+    assert graph.nodes[function_id].type == EntityType.FUNCTION
+    contains = {(e.source_id, e.target_id) for e in graph.edges if e.type == RelationType.CONTAINS}
+    assert contains == {(file_id, class_id), (file_id, function_id)}
+
+    modifies = [e for e in graph.edges if e.type == RelationType.MODIFIES]
+    assert [(e.source_id, e.target_id) for e in modifies] == [
+        (f"commit:{'a' * 40}", file_id)
+    ]
+
+    commit_chunks = {
+        c.metadata["graph_node_id"]: c
+        for c in vectors.chunks if c.metadata.get("type") == "commit"
+    }
+    assert len(commit_chunks) == 2
+    # Stored neighbours use the traversal query's node projection
+    metadata = commit_chunks[f"commit:{'a' * 40}"].metadata
+    assert metadata["graph_neighbors_truncated"] is False
+    assert json.loads(metadata["graph_neighbors"]) == [
+        {"id": "dev:Ada", "vector_id": None, "name": "Ada", "path": None, "sha": None},
+        {"id": file_id, "vector_id": None, "name": "payments.py", "path": "src/payments.py", "sha": None},
+    ]
+    file_chunk = next(c for c in vectors.chunks if c.metadata["graph_node_id"] == file_id)
+    assert json.loads(file_chunk.metadata["graph_neighbors"]) == [
+        {"id": f"commit:{'a' * 40}", "vector_id": None, "name": None, "path": None, "sha": "a" * 40},
+    ]
+    chunk_nodes = {c.metadata["graph_node_id"] for c in vectors.chunks}
+    assert {file_id, class_id, function_id} <= chunk_nodes
+
+
+def test_ingest_repository(repo):
+    graph, vectors = FakeGraphAdapter(), FakeVectorStore()
+    ingestion = DualPipelineIngestion(vectors, graph)
+    result = ingestion.ingest_repository(str(repo), REPO_URL)
+    _check_ingestion(result, graph, vectors)
+
+
+def test_ingest_repository_async(repo):
+    graph, vectors = FakeGraphAdapter(), FakeVectorStore()
+    ingestion = DualPipelineIngestion(vectors, graph)
+    result = asyncio.run(ingestion.ingest_repository_async(str(repo), REPO_URL))
+    _check_ingestion(result, graph, vectors)
+
+
+def test_ingest_repository_bulk_stages_graph_writes_as_csv(repo, tmp_path_factory):
+    graph, vectors = FakeGraphAdapter(tmp_path_factory.mktemp("import")), FakeVectorStore()
+    ingestion = DualPipelineIngestion(vectors, graph)
+    result = ingestion.ingest_repository_bulk(str(repo), REPO_URL, import_dir=graph.import_dir)
+    _check_ingestion(result, graph, vectors)
+    # The staged files are removed once loaded
+    assert list(graph.import_dir.iterdir()) == []
+
+
+def test_ingest_repository_async_stores_chunks_off_the_loop(repo):
+    # Enough commits to fill several chunk batches mid-stream
+    save_commits(
+        (
+            {**COMMITS[1], "hash": f"{i:040x}", "subject": f"Change {i}"}
+            for i in range(600)
+        ),
+        repo / "data" / ".rag_commits",
+    )
+    graph, vectors = FakeGraphAdapter(), FakeVectorStore()
+    ingestion = DualPipelineIngestion(vectors, graph)
+    result = asyncio.run(ingestion.ingest_repository_async(str(repo), REPO_URL))
+
+    assert result["commits_ingested"] == 602
+    assert len(vectors.threads) > 2
+    assert threading.get_ident() not in vectors.threads
+
+
+def test_long_neighbor_lists_are_flagged_truncated(repo):
+    files = [f"src/module_{i}.py" for i in range(GRAPH_NEIGHBORS_LIMIT + 2)]
+    save_commits(
+        [{**COMMITS[1], "hash": "c" * 40, "files_changed": files}],
+        repo / "data" / ".rag_commits",
+    )
+    graph, vectors = FakeGraphAdapter(), FakeVectorStore()
+    DualPipelineIngestion(vectors, graph).ingest_repository(str(repo), REPO_URL)
+
+    metadata = next(
+        c.metadata for c in vectors.chunks
+        if c.metadata["graph_node_id"] == f"commit:{'c' * 40}"
+    )
+    assert metadata["graph_neighbors_truncated"] is True
+    assert len(json.loads(metadata["graph_neighbors"])) == GRAPH_NEIGHBORS_LIMIT
+
+
+@pytest.mark.parametrize("rel_path, skipped", [
+    ("payments.py", False),
+    ("billing/payments.py", False),
+    ("contest/rules.py", False),
+    ("test_payments.py", True),
+    ("billing/payments_test.py", True),
+    ("tests/helpers.py", True),
+    ("billing/test/helpers.py", True),
+    ("Tests/helpers.py", True),
+    ("billing/__pycache__/", True),
+    ("node_modules/pkg/index.py", True),
+    (".venv/", True),
+    ("venv/lib/site.py", True),
+])
+def test_skip_pattern(rel_path, skipped):
+    assert bool(_SKIP_RE.search(rel_path)) is skipped
+
+
+def test_iter_source_files_prunes_skipped_and_hidden_directories(tmp_path):
+    for rel_path in [
+        "app.py",
+        "notes.txt",
+        "billing/payments.py",
+        "billing/test_payments.py",
+        "billing/tests/fixtures.py",
+        "node_modules/pkg/build.py",
+        ".git/hooks/pre_commit.py",
+    ]:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (tmp_path / "linked").symlink_to(tmp_path / "billing", target_is_directory=True)
+
+    found = {
+        p.relative_to(tmp_path).as_posix()
+        for p in iter_source_files(tmp_path, _SKIP_RE)
+    }
+    assert found == {"app.py", "billing/payments.py"}
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Commit Ingestion Tests
+Streaming `git log` parsing against a throwaway repository
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from .ingestion import ingest_commits
+from .ingestion.ingest_commits import get_commits
+
+MESSAGES = [
+    ("Initial commit", ""),
+    ("Add payments", "Handles card payments.\n\nSee the design doc."),
+    ("Fix rounding", "Amounts are now rounded\nhalf to even."),
+]
+
+
+def git(repo: Path, *args: str):
+    subprocess.run(
+        ["git", "-c", "user.name=Ada", "-c", "user.email=ada@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path) -> Path:
+    git(tmp_path, "init", "-q")
+    for subject, body in MESSAGES:
+        message = f"{subject}\n\n{body}" if body else subject
+        git(tmp_path, "commit", "-q", "--allow-empty", "-m", message)
+    return tmp_path
+
+
+def check_commits(commits):
+    # git log lists the newest commit first
+    assert [(c["subject"], c["body"].strip()) for c in commits] == MESSAGES[::-1]
+    assert all(c["author"] == "Ada" and c["email"] == "ada@example.com" for c in commits)
+    assert all(len(c["hash"]) == 40 for c in commits)
+
+
+def test_yields_every_commit(repo):
+    check_commits(list(get_commits(repo)))
+
+
+def test_records_split_across_reads(repo, monkeypatch):
+    # Reads far smaller than a record split fields and separators apart
+    monkeypatch.setattr(ingest_commits, "READ_SIZE", 7)
+    check_commits(list(get_commits(repo)))
+
+
+def test_stopping_early_ends_git_log(repo):
+    commits = get_commits(repo)
+    assert next(commits)["subject"] == "Fix rounding"
+    commits.close()
+
+
+def test_git_errors_are_raised(tmp_path):
+    with pytest.raises(RuntimeError, match="Git log failed"):
+        list(get_commits(tmp_path))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Jira Connector Tests
+JQL building and pagination of issue search results against an in-memory Jira
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from .connectors.base_connector import ConnectorConfig
+from .connectors.jira_connector import JiraConnector, _jql_for
+
+
+def make_issue(number: int) -> Dict[str, Any]:
+    return {
+        "key": f"AST-{number}",
+        "fields": {
+            "summary": f"Issue {number}",
+            "status": {"name": "Open"},
+            "updated": "2025-01-01T10:00:00.000Z",
+            "created": "2025-01-01T09:00:00.000Z",
+            "project": {"key": "AST"},
+            "issuetype": {"name": "Task"},
+        },
+    }
+
+
+class FakeJira(JiraConnector):
+    """Serves search pages from a list, capping each page at `max_page`"""
+
+    def __init__(self, total: int, batch_size: int, max_page: int, short_pages=()):
+        super().__init__(ConnectorConfig(
+            name="jira",
+            api_url="https://jira.example.com",
+            rate_limit=10000,
+            batch_size=batch_size,
+        ))
+        self.issues = [make_issue(i) for i in range(total)]
+        self.max_page = max_page
+        # startAt offsets whose page comes back one issue short
+        self.short_pages = set(short_pages)
+        self.requests: List[Dict[str, Any]] = []
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None, headers=None):
+        self.requests.append(params)
+        start_at = params["startAt"]
+        size = min(params["maxResults"], self.max_page)
+        if start_at in self.short_pages:
+            size -= 1
+        return {
+            "startAt": start_at,
+            "maxResults": size,
+            "total": len(self.issues),
+            "issues": self.issues[start_at:start_at + size],
+        }
+
+
+def fetch_keys(jira: FakeJira, limit: Optional[int] = None) -> List[str]:
+    async def collect():
+        return [e.content["key"] async for e in jira.fetch_entities(limit=limit)]
+    return asyncio.run(collect())
+
+
+def test_fetches_every_issue_in_order():
+    jira = FakeJira(total=23, batch_size=5, max_page=5)
+    assert fetch_keys(jira) == [f"AST-{i}" for i in range(23)]
+    assert len(jira.requests) == 5
+
+
+def test_steps_by_the_page_size_the_server_honours():
+    # The server caps pages at 4 although 10 were requested
+    jira = FakeJira(total=23, batch_size=10, max_page=4)
+    assert fetch_keys(jira) == [f"AST-{i}" for i in range(23)]
+    assert [r["startAt"] for r in jira.requests] == [0, 4, 8, 12, 16, 20]
+
+
+def test_refetches_the_tail_of_a_short_page():
+    jira = FakeJira(total=23, batch_size=5, max_page=5, short_pages={10})
+    assert fetch_keys(jira) == [f"AST-{i}" for i in range(23)]
+    # The page at 10 stopped at 13, so the missing issue 14 is asked for alone
+    assert any(r["startAt"] == 14 and r["maxResults"] == 1 for r in jira.requests)
+
+
+def test_respects_limit():
+    jira = FakeJira(total=23, batch_size=5, max_page=5)
+    assert fetch_keys(jira, limit=12) == [f"AST-{i}" for i in range(12)]
+    assert jira.requests[-1]["maxResults"] == 2
+
+
+def build_jql(filters):
+    return FakeJira(total=0, batch_size=5, max_page=5)._build_jql(filters)
+
+
+def test_jql_without_filters_only_orders():
+    assert build_jql(None) == "ORDER BY updated DESC"
+    assert build_jql({}) == "ORDER BY updated DESC"
+
+
+def test_jql_clauses_follow_the_builder_order():
+    filters = {"assignee": "ada", "updated_after": "2025-01-01", "project": "AST"}
+    assert build_jql(filters) == (
+        "project = AST AND updated >= 2025-01-01 AND assignee = ada ORDER BY updated DESC"
+    )
+
+
+def test_jql_ignores_unknown_filters():
+    assert build_jql({"project": "AST", "colour": "blue"}) == (
+        "project = AST ORDER BY updated DESC"
+    )
+
+
+def test_jql_is_memoized_per_filter_set():
+    _jql_for.cache_clear()
+    build_jql({"project": "AST"})
+    build_jql({"project": "AST"})
+    assert _jql_for.cache_info().hits == 1
+
+
+def test_jql_with_unhashable_filter_values_is_built_uncached():
+    _jql_for.cache_clear()
+    assert build_jql({"project": ["AST"]}) == "project = ['AST'] ORDER BY updated DESC"
+    assert _jql_for.cache_info().currsize == 0
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Modular Ingestion Engine Tests
+Queue draining and pipelined job status writes of the ingestion orchestrator
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from .ingestion.modular_ingestion_engine import (
+    PIPELINE_MAX_OPS,
+    IngestionOrchestrator,
+    _drain,
+    shutdown_orchestrators,
+)
+
+
+def filled_queue(*items) -> asyncio.Queue:
+    queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+    return queue
+
+
+def test_drain_takes_what_is_queued_up_to_the_limit():
+    async def run():
+        queue = filled_queue(*range(5))
+        first = await _drain(queue, max_items=3, max_wait=1.0)
+        second = await _drain(queue, max_items=3, max_wait=0.01)
+        return first, second
+
+    assert asyncio.run(run()) == ([0, 1, 2], [3, 4])
+
+
+def test_drain_waits_for_stragglers_until_the_deadline():
+    async def run():
+        queue = filled_queue("a")
+
+        async def produce():
+            await asyncio.sleep(0.01)
+            queue.put_nowait("b")
+            await asyncio.sleep(0.5)
+            queue.put_nowait("late")
+
+        producer = asyncio.create_task(produce())
+        started = time.monotonic()
+        items = await _drain(queue, max_items=10, max_wait=0.1)
+        elapsed = time.monotonic() - started
+        producer.cancel()
+        return items, elapsed
+
+    items, elapsed = asyncio.run(run())
+    assert items == ["a", "b"]
+    assert elapsed < 0.4
+
+
+def test_drain_blocks_for_the_first_item():
+    async def run():
+        queue = asyncio.Queue()
+        asyncio.get_running_loop().call_later(0.05, queue.put_nowait, "first")
+        return await _drain(queue, max_items=10, max_wait=0)
+
+    assert asyncio.run(run()) == ["first"]
+
+
+class FakePipeline:
+    """Collects job updates and records how many executes overlap"""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: List[Tuple[str, Dict[str, Any]]] = []
+
+    def eval(self, script: str, numkeys: int, key: str, ttl: int, *pairs):
+        self.commands.append((key, dict(zip(pairs[::2], pairs[1::2]))))
+
+    async def execute(self):
+        self.redis.in_flight += 1
+        self.redis.max_in_flight = max(self.redis.max_in_flight, self.redis.in_flight)
+        # Yield so a concurrent flush could start mid-execute
+        await asyncio.sleep(0.01)
+        self.redis.batches.append(self.commands)
+        self.redis.in_flight -= 1
+
+
+class FakeRedis:
+    def __init__(self):
+        self.batches: List[List[Tuple[str, Dict[str, Any]]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+def test_concurrent_flushes_run_one_at_a_time_and_in_order():
+    async def run():
+        orchestrator = IngestionOrchestrator()
+        orchestrator.redis = FakeRedis()
+        for i in range(PIPELINE_MAX_OPS - 1):
+            await orchestrator.update_job_fields("job", {"n": i})
+        # A periodic flush and a threshold-triggered flush at the same time
+        periodic = asyncio.create_task(orchestrator.flush_pipeline())
+        await asyncio.sleep(0)
+        for i in range(PIPELINE_MAX_OPS - 1, 2 * PIPELINE_MAX_OPS):
+            await orchestrator.update_job_fields("job", {"n": i})
+        await periodic
+        await orchestrator.flush_pipeline()
+        return orchestrator.redis
+
+    redis = asyncio.run(run())
+    assert redis.max_in_flight == 1
+    written = [fields["n"] for batch in redis.batches for _, fields in batch]
+    assert written == list(range(2 * PIPELINE_MAX_OPS))
+
+
+def test_terminal_updates_are_flushed_at_once():
+    async def run():
+        orchestrator = IngestionOrchestrator()
+        orchestrator.redis = FakeRedis()
+        await orchestrator.update_job_fields("job", {"status": "processing"})
+        buffered = list(orchestrator.redis.batches)
+        await orchestrator.update_job_fields("job", {"status": "completed"}, flush=True)
+        return buffered, orchestrator.redis.batches
+
+    buffered, batches = asyncio.run(run())
+    assert buffered == []
+    assert batches == [[
+        ("ingestion_job:job", {"status": "processing"}),
+        ("ingestion_job:job", {"status": "completed"}),
+    ]]
+
+
+class FakeConnector:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_shutdown_orchestrators_releases_every_initialized_orchestrator():
+    async def run():
+        orchestrator = IngestionOrchestrator()
+        await orchestrator.initialize()
+        connector = FakeConnector()
+        orchestrator.register_connector("jira", connector)
+        await shutdown_orchestrators()
+        # A second shutdown finds nothing left to release
+        await shutdown_orchestrators()
+        return orchestrator, connector
+
+    orchestrator, connector = asyncio.run(run())
+    assert connector.closed
+    assert orchestrator._pipeline_flusher is None
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Retrieval Disk Cache Tests
+Key scoping, expiry and invalidation of persisted hybrid search results
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from .hybrid import retrieval_disk_cache
+from .hybrid.retrieval_disk_cache import RetrievalDiskCache
+
+CONFIG = {"graph_weight": 0.3, "vector_weight": 0.7}
+
+
+@dataclass
+class Result:
+    reasoning_path: List[str]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    disk_cache = RetrievalDiskCache(tmp_path / "cache.db", ttl_seconds=60)
+    yield disk_cache
+    disk_cache.close()
+
+
+def key(query: str = "payments", collection: str = "docs", graph_uri=None) -> str:
+    return RetrievalDiskCache.make_key(query, "general", 10, 2, CONFIG, collection, graph_uri)
+
+
+def test_round_trip(cache):
+    cache.put(key(), Result(["step"]))
+    assert cache.get(key()) == {"reasoning_path": ["step"]}
+    assert cache.get(key("refunds")) is None
+
+
+def test_keys_are_scoped_to_the_corpus():
+    assert key() != key(collection="other")
+    assert key() != key(graph_uri="bolt://graph:7687")
+    assert key(graph_uri="bolt://graph:7687") == key(graph_uri="bolt://graph:7687")
+
+
+class FakeClock:
+    """Stands in for the time module so stored results can age instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+def test_expired_results_miss(cache, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(retrieval_disk_cache, "time", clock)
+    cache.put(key(), Result([]))
+    clock.now += 59
+    assert cache.get(key()) is not None
+    clock.now += 2
+    assert cache.get(key()) is None
+
+
+def test_clear_drops_results(cache):
+    cache.put(key(), Result([]))
+    cache.clear()
+    assert cache.get(key()) is None
+
+
+def test_results_computed_before_a_clear_are_not_stored(cache):
+    generation = cache.generation
+    # The corpus changes while the search is running
+    cache.clear()
+    cache.put(key(), Result(["stale"]), generation)
+    assert cache.get(key()) is None
+
+    cache.put(key(), Result(["fresh"]), cache.generation)
+    assert cache.get(key()) == {"reasoning_path": ["fresh"]}
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Semantic Cache Tests
+Similarity lookup, LRU eviction and TTL expiry of the hybrid search cache
+"""
+
+import numpy as np
+import pytest
+
+from .hybrid import semantic_cache
+from .hybrid.semantic_cache import SemanticCache
+
+DIMENSION = 8
+
+
+class FakeClock:
+    """Stands in for the time module so TTLs can expire instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(semantic_cache, "time", fake)
+    return fake
+
+
+def unit(index: int) -> np.ndarray:
+    vec = np.zeros(DIMENSION, dtype=np.float32)
+    vec[index] = 1.0
+    return vec
+
+
+def test_hit_for_identical_and_near_identical_queries():
+    cache = SemanticCache(DIMENSION, similarity_threshold=0.95)
+    cache.put(unit(0), "result")
+
+    assert cache.get(unit(0)) == "result"
+    # Scale doesn't matter, and a small perturbation stays above the threshold
+    assert cache.get(unit(0) * 3) == "result"
+    assert cache.get(unit(0) + 0.01 * unit(1)) == "result"
+    assert cache.stats()["cache_hits"] == 3
+
+
+def test_miss_for_dissimilar_query():
+    cache = SemanticCache(DIMENSION)
+    cache.put(unit(0), "result")
+
+    assert cache.get(unit(1)) is None
+    assert cache.stats() == {
+        "entries": 1,
+        "cache_hits": 0,
+        "cache_misses": 1,
+        "hit_rate": 0.0,
+    }
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SemanticCache(DIMENSION, max_entries=2)
+    cache.put(unit(0), "a")
+    cache.put(unit(1), "b")
+    # Touch "a" so "b" becomes the least recently used
+    assert cache.get(unit(0)) == "a"
+    cache.put(unit(2), "c")
+
+    assert cache.get(unit(1)) is None
+    assert cache.get(unit(0)) == "a"
+    assert cache.get(unit(2)) == "c"
+    assert cache.stats()["entries"] == 2
+
+
+def test_expired_entries_miss_and_are_dropped(clock):
+    cache = SemanticCache(DIMENSION, ttl_seconds=60)
+    cache.put(unit(0), "result")
+
+    clock.now += 59
+    assert cache.get(unit(0)) == "result"
+    clock.now += 2
+    assert cache.get(unit(0)) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_clear_drops_everything():
+    cache = SemanticCache(DIMENSION)
+    cache.put(unit(0), "a")
+    cache.put(unit(1), "b")
+    cache.clear()
+
+    assert cache.get(unit(0)) is None
+    assert cache.stats()["entries"] == 0